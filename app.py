@@ -4,15 +4,17 @@ Main application with Gradio web interface for local hosting.
 """
 
 import os
+import re
 import sys
+import uuid
+import asyncio
 import logging
 import argparse
 from datetime import datetime
+from functools import partial
 from dotenv import load_dotenv
-import gradio as gr
 
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-from langchain_community.vectorstores import FAISS
+from langchain_openai import ChatOpenAI
 
 # Import API clients
 from market_data_api import MarketDataAPI
@@ -29,16 +31,56 @@ from guardrails import create_guardrails, FinanceGuardrails
 log_dir = os.path.join(os.path.dirname(__file__), 'logs')
 os.makedirs(log_dir, exist_ok=True)
 
+# Route log records through an in-memory queue: logger calls on the request
+# path are O(enqueue), while a background listener thread does the actual
+# file/console writes so disk I/O never blocks query processing
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler(
+    os.path.join(log_dir, f'finance_assistant_{datetime.now().strftime("%Y%m%d")}.log')
+)
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(_log_formatter)
+
+_log_queue = queue.Queue(-1)
+_log_listener = QueueListener(
+    _log_queue, _file_handler, _stream_handler, respect_handler_level=True
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(os.path.join(log_dir, f'finance_assistant_{datetime.now().strftime("%Y%m%d")}.log')),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
 
+# Module-level retriever cache so re-initializing the assistant (tests,
+# multi-worker reloads) doesn't reload the FAISS index into RAM each time
+_RETRIEVER_CACHE = {}
+
+# Candidate ticker symbols for speculative prefetch: 1-5 uppercase letters,
+# minus common all-caps words that appear in finance questions
+_TICKER_RE = re.compile(r"\b[A-Z]{1,5}\b")
+_TICKER_STOPWORDS = frozenset({
+    "I", "A", "AI", "ETF", "ETFS", "IRA", "ROTH", "HSA", "USD", "US", "USA",
+    "CEO", "IPO", "NYSE", "S", "P", "DOW", "VS", "OK", "FAQ", "API", "PE"
+})
+
+# Canned queries behind the quick-example buttons, built once at import
+# instead of inside every handler call
+EXAMPLES = {
+    "stock_price": "What's the current price of Apple stock?",
+    "portfolio": "Analyze this portfolio: AAPL (10 shares), MSFT (15 shares), GOOGL (5 shares)",
+    "retirement": "I'm 30 years old and want to retire at 65. If I save $500/month with 7% returns, how much will I have?",
+    "tax": "What's the difference between a Traditional IRA and Roth IRA?",
+    "education": "What is diversification and why is it important?"
+}
+
 
 class AIFinanceAssistant:
     """Main AI Finance Assistant system with multi-agent coordination."""
@@ -51,12 +93,28 @@ class AIFinanceAssistant:
     ):
         """Initialize the AI Finance Assistant."""
         logger.info("🚀 Initializing AI Finance Assistant...")
-        
+
+        # One shared HTTP connection pool for all OpenAI traffic (LLM +
+        # embeddings) so each component doesn't pay its own TCP/TLS
+        # handshakes; HTTP/2 multiplexes concurrent calls when available
+        import httpx
+        limits = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        try:
+            self.http_client = httpx.Client(http2=True, limits=limits, timeout=30)
+            self.http_async_client = httpx.AsyncClient(http2=True, limits=limits, timeout=30)
+        except ImportError:
+            # h2 package not installed - plain HTTP/1.1 keep-alive still pools
+            self.http_client = httpx.Client(limits=limits, timeout=30)
+            self.http_async_client = httpx.AsyncClient(limits=limits, timeout=30)
+
         # Initialize LLM
         self.llm = ChatOpenAI(
             api_key=openai_api_key,
             model=os.getenv("LLM_MODEL", "gpt-4o-mini"),
-            temperature=float(os.getenv("LLM_TEMPERATURE", "0.3"))
+            temperature=float(os.getenv("LLM_TEMPERATURE", "0.3")),
+            streaming=True,
+            http_client=self.http_client,
+            http_async_client=self.http_async_client
         )
         logger.info(f"✅ LLM initialized: {os.getenv('LLM_MODEL', 'gpt-4o-mini')}")
         
@@ -65,6 +123,10 @@ class AIFinanceAssistant:
         self.news_api = FinancialNewsAPI(news_api_key)
         self.web_scraper = FinancialWebScraper()
         logger.info("✅ API clients initialized")
+
+        # Keep the trending universe's quotes warm so the UI hot path
+        # stays a cache hit (daemon thread; dies with the process)
+        self.market_data_api.prefetch_trending()
         
         # Load knowledge base (optional)
         self.retriever = self._load_knowledge_base(openai_api_key)
@@ -79,31 +141,180 @@ class AIFinanceAssistant:
         )
         logger.info(f"✅ Created {len(self.agents)} specialized agents")
         
+        # Per-provider concurrency caps: unbounded fan-out would stampede
+        # OpenAI/yfinance into 429 responses whose retry backoff costs more
+        # than the concurrency wins
+        self.sem = {
+            "openai": asyncio.Semaphore(int(os.getenv("OPENAI_CONCURRENCY", "20"))),
+            "yf": asyncio.Semaphore(int(os.getenv("YFINANCE_CONCURRENCY", "8")))
+        }
+
+        # Strong references to in-flight prefetch tasks: the event loop
+        # only keeps weak ones, so fire-and-forget tasks could be
+        # garbage-collected mid-flight otherwise
+        self._prefetch_tasks = set()
+
         # Create router and orchestrator
         self.router = create_router(self.llm)
-        self.orchestrator = create_orchestrator(self.llm, self.agents)
+        self.orchestrator = create_orchestrator(
+            self.llm, self.agents, llm_semaphore=self.sem["openai"]
+        )
         logger.info("✅ Router and orchestrator initialized")
         
         # Initialize guardrails
         self.guardrails = create_guardrails(self.llm)
         logger.info("✅ Guardrails system initialized")
+
+        # Rendered lazily by get_system_info and reused afterwards
+        self._system_info = None
         
         logger.info("🎉 AI Finance Assistant ready!")
     
+    @staticmethod
+    def _cached_embeddings(embeddings):
+        """Wrap an embeddings client with an on-disk query cache.
+
+        Repeated queries skip the OpenAI round-trip entirely (optional —
+        falls back to the plain client if the cache helpers are
+        unavailable). The cache is namespaced by model, so KBs built with
+        different embedding models don't poison each other.
+        """
+        try:
+            from langchain.embeddings import CacheBackedEmbeddings
+            from langchain.storage import LocalFileStore
+
+            store = LocalFileStore("./knowledge_base/emb_cache")
+            cached = CacheBackedEmbeddings.from_bytes_store(
+                embeddings,
+                store,
+                namespace=embeddings.model,
+                query_embedding_cache=True
+            )
+            logger.info("✅ Embedding cache enabled (./knowledge_base/emb_cache)")
+            return cached
+        except ImportError:
+            logger.warning("⚠️  CacheBackedEmbeddings unavailable - embeddings not cached")
+            return embeddings
+
     def _load_knowledge_base(self, openai_api_key: str):
         """Load FAISS knowledge base if available."""
         try:
-            embeddings = OpenAIEmbeddings(api_key=openai_api_key)
+            # Imported here so the FAISS C extension and embeddings client
+            # only load when a knowledge base is actually used
+            from langchain_openai import OpenAIEmbeddings
+            from langchain_community.vectorstores import FAISS
+
             knowledge_base_path = "./knowledge_base/faiss_index"
-            
+
+            # Reuse an already-loaded retriever across re-initializations
+            if knowledge_base_path in _RETRIEVER_CACHE:
+                logger.info("✅ Reusing cached knowledge base retriever")
+                return _RETRIEVER_CACHE[knowledge_base_path]
+
             if os.path.exists(knowledge_base_path):
                 logger.info(f"Loading knowledge base from {knowledge_base_path}")
-                vector_store = FAISS.load_local(
-                    knowledge_base_path,
-                    embeddings,
-                    allow_dangerous_deserialization=True
-                )
+                index_file = os.path.join(knowledge_base_path, "index.faiss")
+                docstore_file = os.path.join(knowledge_base_path, "docstore.jsonl")
+
+                if os.path.exists(docstore_file):
+                    # Split format: mmap the raw index read-only (the OS page
+                    # cache backs it, shared across worker processes) and read
+                    # the docstore from JSONL — no pickle deserialization
+                    # involved
+                    import json
+                    import faiss
+                    from langchain_core.documents import Document
+                    from langchain_community.docstore.in_memory import InMemoryDocstore
+                    from langchain_community.vectorstores.utils import DistanceStrategy
+
+                    try:
+                        index = faiss.read_index(
+                            index_file,
+                            faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                        )
+                        logger.info("✅ FAISS index memory-mapped")
+                    except Exception as mmap_error:
+                        logger.warning(f"⚠️  Could not mmap FAISS index, using in-RAM copy: {mmap_error}")
+                        index = faiss.read_index(index_file)
+
+                    # The embedding model must match the dimension the index
+                    # was actually built at, not the file format: KBs from
+                    # create_finance_knowledge_base.py use
+                    # text-embedding-3-small truncated to 512 dims, while
+                    # legacy 1536-dim KBs migrated by build_index.py keep the
+                    # old default model. Mixing them up breaks every query
+                    # with a dimension mismatch.
+                    if index.d == 512:
+                        embeddings = OpenAIEmbeddings(
+                            api_key=openai_api_key,
+                            model="text-embedding-3-small",
+                            dimensions=512,
+                            http_client=self.http_client,
+                            http_async_client=self.http_async_client
+                        )
+                    else:
+                        embeddings = OpenAIEmbeddings(
+                            api_key=openai_api_key,
+                            http_client=self.http_client,
+                            http_async_client=self.http_async_client
+                        )
+                    embeddings = self._cached_embeddings(embeddings)
+
+                    docs, index_to_id = {}, {}
+                    with open(docstore_file, encoding="utf-8") as f:
+                        for line in f:
+                            record = json.loads(line)
+                            doc_id = str(record["id"])
+                            docs[doc_id] = Document(
+                                page_content=record["text"],
+                                metadata=record.get("metadata", {})
+                            )
+                            index_to_id[record["id"]] = doc_id
+
+                    # Migrated legacy indexes keep their L2 metric; only the
+                    # normalized-vector pipeline uses inner product
+                    if index.metric_type == faiss.METRIC_INNER_PRODUCT:
+                        strategy = DistanceStrategy.MAX_INNER_PRODUCT
+                    else:
+                        strategy = DistanceStrategy.EUCLIDEAN_DISTANCE
+
+                    vector_store = FAISS(
+                        embedding_function=embeddings,
+                        index=index,
+                        docstore=InMemoryDocstore(docs),
+                        index_to_docstore_id=index_to_id,
+                        distance_strategy=strategy
+                    )
+                else:
+                    # Legacy pickled save_local format, embedded with the
+                    # 1536-dim default model
+                    embeddings = self._cached_embeddings(OpenAIEmbeddings(
+                        api_key=openai_api_key,
+                        http_client=self.http_client,
+                        http_async_client=self.http_async_client
+                    ))
+                    vector_store = FAISS.load_local(
+                        knowledge_base_path,
+                        embeddings,
+                        allow_dangerous_deserialization=True
+                    )
+                    try:
+                        import faiss
+                        vector_store.index = faiss.read_index(
+                            index_file,
+                            faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+                        )
+                        logger.info("✅ FAISS index memory-mapped")
+                    except Exception as mmap_error:
+                        logger.warning(f"⚠️  Could not mmap FAISS index, using in-RAM copy: {mmap_error}")
+
+                # IVF-style indexes (see build_index.py) need nprobe set to
+                # balance recall vs. speed; harmless no-op for flat indexes
+                if hasattr(vector_store.index, "nprobe"):
+                    vector_store.index.nprobe = 8
+
                 retriever = vector_store.as_retriever(search_kwargs={"k": 3})
+                _RETRIEVER_CACHE[knowledge_base_path] = retriever
                 logger.info("✅ Knowledge base loaded successfully")
                 return retriever
             else:
@@ -137,14 +348,21 @@ class AIFinanceAssistant:
             logger.info("✅ Input validation passed")
             
             # Step 2: Check query intent (optional safety check)
-            intent_check = self.guardrails.check_query_intent(sanitized_query)
+            if self.guardrails.requires_intent_check(sanitized_query):
+                intent_check = self.guardrails.check_query_intent(sanitized_query)
+            else:
+                intent_check = {"safe": True, "requires_extra_disclaimer": True}
             if not intent_check.get("safe", True):
                 logger.warning(f"❌ Query intent check failed")
                 return "⚠️ I cannot assist with this type of query. Please ask about general financial education, investment concepts, or portfolio planning.", "Intent check failed"
             
-            # Step 3: Route the query
-            agent_names = self.router.route_query(sanitized_query)
-            routing_info = self.router.explain_routing(sanitized_query, agent_names)
+            # Step 3: Route the query — regex fast path for obvious intents,
+            # LLM routing (agents + explanation in one call) otherwise
+            agent_names = self.router.fast_route(sanitized_query)
+            if agent_names is not None:
+                routing_info = self.router.explain_routing(sanitized_query, agent_names)
+            else:
+                agent_names, routing_info = self.router.route_and_explain(sanitized_query)
             logger.info(f"🔀 {routing_info}")
             
             # Step 4: Execute agent(s)
@@ -176,8 +394,214 @@ class AIFinanceAssistant:
             error_msg = f"I apologize, but I encountered an error processing your question: {str(e)}\n\nPlease try rephrasing your question or contact support if the issue persists."
             return error_msg, "Error occurred"
     
+    def _prefetch_market_data(self, query: str) -> list:
+        """
+        Speculatively warm the market data cache while routing runs.
+
+        Tickers mentioned in the query are fetched in background threads so
+        that by the time the market analyst's tools ask for a quote, it is
+        already a cache hit. Prefetches the agents never consult simply age
+        out of the cache; quote lookups are idempotent so this is safe.
+
+        Args:
+            query: Sanitized user query
+
+        Returns:
+            List of asyncio Tasks (possibly empty) warming the cache
+        """
+        tickers = [
+            t for t in _TICKER_RE.findall(query)
+            if t not in _TICKER_STOPWORDS
+        ][:5]
+
+        if not tickers:
+            return []
+
+        async def fetch(ticker: str):
+            async with self.sem["yf"]:
+                return await asyncio.to_thread(
+                    self.market_data_api.get_stock_quote, ticker
+                )
+
+        logger.info(f"⚡ Speculatively prefetching quotes: {', '.join(tickers)}")
+        tasks = [asyncio.create_task(fetch(ticker)) for ticker in tickers]
+        # Keep each task alive until it finishes; callers are free to
+        # ignore the returned list
+        for task in tasks:
+            self._prefetch_tasks.add(task)
+            task.add_done_callback(self._prefetch_tasks.discard)
+        return tasks
+
+    async def aprocess_query(self, query: str, thread_id: str = "default") -> tuple:
+        """
+        Async version of process_query.
+
+        Multi-agent queries fan out with asyncio.gather so the per-agent
+        LLM round-trips overlap instead of stacking end-to-end.
+
+        Args:
+            query: User's question
+            thread_id: Conversation thread ID
+
+        Returns:
+            Tuple of (response, routing_info)
+        """
+        logger.info(f"📥 Processing query (async): {query[:100]}...")
+
+        try:
+            # Step 1: Validate input with guardrails
+            is_valid, sanitized_query, error_msg = self.guardrails.validate_input(query, thread_id)
+
+            if not is_valid:
+                logger.warning(f"❌ Input validation failed: {error_msg}")
+                return error_msg, "Input validation failed"
+
+            logger.info("✅ Input validation passed")
+
+            # Step 2: Check query intent (optional safety check)
+            if self.guardrails.requires_intent_check(sanitized_query):
+                intent_check = self.guardrails.check_query_intent(sanitized_query)
+            else:
+                intent_check = {"safe": True, "requires_extra_disclaimer": True}
+            if not intent_check.get("safe", True):
+                logger.warning(f"❌ Query intent check failed")
+                return "⚠️ I cannot assist with this type of query. Please ask about general financial education, investment concepts, or portfolio planning.", "Intent check failed"
+
+            # Step 3: Plan the query (agents + dependencies + explanation in
+            # one LLM call) while speculative prefetches warm the data cache
+            self._prefetch_market_data(sanitized_query)
+            fast = self.router.fast_route_plan(sanitized_query)
+            if fast is not None:
+                plan, routing_info = fast
+            else:
+                plan, routing_info = await self.router.aplan_and_explain(
+                    sanitized_query
+                )
+            logger.info(f"🔀 {routing_info}")
+
+            # Step 4: Execute the plan — independent agents run concurrently,
+            # dependent agents wait only for their upstream outputs
+            if len(plan) == 1:
+                response = await self.orchestrator.execute_single_agent_async(
+                    plan[0].agent,
+                    sanitized_query,
+                    thread_id
+                )
+            else:
+                response = await self.orchestrator.run_plan(
+                    plan,
+                    sanitized_query,
+                    thread_id
+                )
+
+            # Step 5: Validate output with guardrails
+            is_valid_output, enhanced_response, output_error = self.guardrails.validate_output(response, sanitized_query)
+
+            if not is_valid_output:
+                logger.warning(f"❌ Output validation failed: {output_error}")
+                return output_error, routing_info
+
+            logger.info(f"✅ Response generated and validated ({len(enhanced_response)} chars)")
+            return enhanced_response, routing_info
+
+        except Exception as e:
+            logger.error(f"❌ Error processing query: {e}", exc_info=True)
+            error_msg = f"I apologize, but I encountered an error processing your question: {str(e)}\n\nPlease try rephrasing your question or contact support if the issue persists."
+            return error_msg, "Error occurred"
+
+    async def stream_query(self, query: str, thread_id: str = "default"):
+        """
+        Stream a response to a user query as (partial_text, routing_info) tuples.
+
+        Tokens are yielded as they arrive from the LLM so the UI can render
+        partial responses instead of blocking on the full generation. Output
+        guardrails run once on the accumulated text, so the final yield may
+        append disclaimers.
+
+        Args:
+            query: User's question
+            thread_id: Conversation thread ID
+
+        Yields:
+            Tuples of (partial_response, routing_info)
+        """
+        logger.info(f"📥 Streaming query: {query[:100]}...")
+
+        try:
+            # Step 1: Validate input with guardrails
+            is_valid, sanitized_query, error_msg = self.guardrails.validate_input(query, thread_id)
+
+            if not is_valid:
+                logger.warning(f"❌ Input validation failed: {error_msg}")
+                yield error_msg, "Input validation failed"
+                return
+
+            # Step 2: Check query intent (optional safety check)
+            if self.guardrails.requires_intent_check(sanitized_query):
+                intent_check = self.guardrails.check_query_intent(sanitized_query)
+            else:
+                intent_check = {"safe": True, "requires_extra_disclaimer": True}
+            if not intent_check.get("safe", True):
+                logger.warning(f"❌ Query intent check failed")
+                yield "⚠️ I cannot assist with this type of query. Please ask about general financial education, investment concepts, or portfolio planning.", "Intent check failed"
+                return
+
+            # Step 3: Plan the query (agents + dependencies + explanation in
+            # one LLM call) while speculative prefetches warm the data cache
+            self._prefetch_market_data(sanitized_query)
+            fast = self.router.fast_route_plan(sanitized_query)
+            if fast is not None:
+                plan, routing_info = fast
+            else:
+                plan, routing_info = await self.router.aplan_and_explain(
+                    sanitized_query
+                )
+            logger.info(f"🔀 {routing_info}")
+
+            # Step 4: Execute agent(s) — stream single agents token-by-token;
+            # multi-agent answers need synthesis, so they arrive in one piece
+            response = ""
+            if len(plan) == 1:
+                async for delta in self.orchestrator.stream_single_agent(
+                    plan[0].agent,
+                    sanitized_query,
+                    thread_id
+                ):
+                    response += delta
+                    yield response, routing_info
+            else:
+                response = await self.orchestrator.run_plan(
+                    plan,
+                    sanitized_query,
+                    thread_id
+                )
+                yield response, routing_info
+
+            # Step 5: Validate output with guardrails (may append disclaimers)
+            is_valid_output, enhanced_response, output_error = self.guardrails.validate_output(response, sanitized_query)
+
+            if not is_valid_output:
+                logger.warning(f"❌ Output validation failed: {output_error}")
+                yield output_error, routing_info
+                return
+
+            logger.info(f"✅ Response streamed and validated ({len(enhanced_response)} chars)")
+            yield enhanced_response, routing_info
+
+        except Exception as e:
+            logger.error(f"❌ Error streaming query: {e}", exc_info=True)
+            error_msg = f"I apologize, but I encountered an error processing your question: {str(e)}\n\nPlease try rephrasing your question or contact support if the issue persists."
+            yield error_msg, "Error occurred"
+
     def get_system_info(self) -> str:
-        """Get information about the system and available agents."""
+        """Get information about the system and available agents.
+
+        The agent roster is fixed after initialization, so the rendered
+        markdown is built once and reused on subsequent calls.
+        """
+        if self._system_info is not None:
+            return self._system_info
+
         info = "## 🤖 AI Finance Assistant - System Information\n\n"
         info += "### Available Agents:\n\n"
         
@@ -186,13 +610,18 @@ class AIFinanceAssistant:
             info += f"**{details['name']}**\n"
             info += f"- Tools: {details['tool_count']}\n"
             info += f"- Capabilities: {', '.join(details['tools'])}\n\n"
-        
+
+        self._system_info = info
         return info
 
 
 def create_gradio_interface(assistant: AIFinanceAssistant):
     """Create Gradio web interface."""
-    
+    # Deferred: gradio is a multi-second import and only needed when the
+    # web UI is actually launched (not for --help or library use)
+    import gradio as gr
+
+
     # Custom CSS for better appearance
     custom_css = """
     .gradio-container {
@@ -206,34 +635,30 @@ def create_gradio_interface(assistant: AIFinanceAssistant):
     }
     """
     
-    def chat_interface(message, history):
-        """Process chat message and return response."""
+    async def chat_interface(message, history, session_id):
+        """Process chat message, streaming partial responses into history."""
+        # Per-browser-session thread ID so concurrent users don't share
+        # conversation state or rate-limit buckets
+        if not session_id:
+            session_id = uuid.uuid4().hex
+
         if not message or message.strip() == "":
-            return history
-        
-        # Process query
-        response, routing_info = assistant.process_query(message)
-        
-        # Format response with routing info
-        full_response = f"*{routing_info}*\n\n{response}"
-        
+            yield history, session_id
+            return
+
         # Gradio 6.0 format with dictionaries (required for avatar_images)
         history.append({"role": "user", "content": message})
-        history.append({"role": "assistant", "content": full_response})
-        
-        return history
+        history.append({"role": "assistant", "content": ""})
+
+        # Stream tokens as they arrive so the user sees output immediately
+        async for response, routing_info in assistant.stream_query(message, thread_id=session_id):
+            history[-1]["content"] = f"*{routing_info}*\n\n{response}"
+            yield history, session_id
     
     def get_quick_example(example_type):
         """Return example queries."""
-        examples = {
-            "stock_price": "What's the current price of Apple stock?",
-            "portfolio": "Analyze this portfolio: AAPL (10 shares), MSFT (15 shares), GOOGL (5 shares)",
-            "retirement": "I'm 30 years old and want to retire at 65. If I save $500/month with 7% returns, how much will I have?",
-            "tax": "What's the difference between a Traditional IRA and Roth IRA?",
-            "education": "What is diversification and why is it important?"
-        }
-        return examples.get(example_type, "")
-    
+        return EXAMPLES.get(example_type, "")
+
     # Create Gradio interface
     with gr.Blocks(title="AI Finance Assistant") as interface:
         gr.Markdown("""
@@ -295,32 +720,40 @@ def create_gradio_interface(assistant: AIFinanceAssistant):
             system_info = gr.Markdown(assistant.get_system_info())
         
         # Event handlers
-        # Event handlers
-        def submit_and_clear(message, history):
+        session_state = gr.State(None)
+
+        async def submit_and_clear(message, history, session_id):
             """Submit message and clear input."""
-            updated_history = chat_interface(message, history)
-            return updated_history, ""
-        
+            async for updated_history, session_id in chat_interface(message, history, session_id):
+                yield updated_history, "", session_id
+
         submit_btn.click(
             submit_and_clear,
-            inputs=[msg_input, chatbot],
-            outputs=[chatbot, msg_input]
+            inputs=[msg_input, chatbot, session_state],
+            outputs=[chatbot, msg_input, session_state],
+            concurrency_limit=8
         )
-        
+
         msg_input.submit(
             submit_and_clear,
-            inputs=[msg_input, chatbot],
-            outputs=[chatbot, msg_input]
+            inputs=[msg_input, chatbot, session_state],
+            outputs=[chatbot, msg_input, session_state],
+            concurrency_limit=8
         )
         
         clear_btn.click(lambda: [], outputs=[chatbot])
         
-        # Quick example buttons
-        stock_btn.click(lambda: get_quick_example("stock_price"), outputs=[msg_input])
-        portfolio_btn.click(lambda: get_quick_example("portfolio"), outputs=[msg_input])
-        retirement_btn.click(lambda: get_quick_example("retirement"), outputs=[msg_input])
-        tax_btn.click(lambda: get_quick_example("tax"), outputs=[msg_input])
-        education_btn.click(lambda: get_quick_example("education"), outputs=[msg_input])
+        # Quick example buttons share one parameterized handler instead of
+        # a closure per button
+        example_buttons = {
+            "stock_price": stock_btn,
+            "portfolio": portfolio_btn,
+            "retirement": retirement_btn,
+            "tax": tax_btn,
+            "education": education_btn
+        }
+        for example_type, btn in example_buttons.items():
+            btn.click(partial(get_quick_example, example_type), outputs=[msg_input])
         
         gr.Markdown("""
         ---
@@ -350,7 +783,15 @@ def main():
     
     # Load environment variables
     load_dotenv()
-    
+
+    # Faster event loop for the async streaming/fan-out paths (optional)
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("✅ uvloop event loop installed")
+    except ImportError:
+        logger.info("uvloop not installed - using default asyncio event loop")
+
     # Check for required API key
     openai_api_key = os.getenv("OPENAI_API_KEY")
     if not openai_api_key:
@@ -393,6 +834,12 @@ def main():
         print("🔗 Creating public link (share=True)...")
     print(f"{'='*60}\n")
     
+    # Queue is required for streaming (generator) handlers and lets
+    # concurrent users run in parallel instead of serializing on one worker
+    interface.queue(
+        default_concurrency_limit=int(os.getenv("GRADIO_CONCURRENCY", "8")),
+        max_size=64
+    )
     interface.launch(
         server_name=args.host,
         server_port=args.port,
@@ -0,0 +1,137 @@
+"""
+Rebuild FAISS Index with IVF + Quantization
+
+One-time utility that converts the knowledge base's flat FAISS index
+(IndexFlatL2 — exhaustive scan over every FP32 vector) into an IVF index
+with compressed storage for sub-linear search and a much smaller memory
+footprint as the knowledge base grows. Two codecs are supported:
+
+- sq8 (default): int8 scalar quantization. 4x smaller than FP32, SIMD
+  int8 distance kernels, negligible recall loss at embedding dimensions
+  like 1536.
+- pq: product quantization. Much stronger compression for large corpora,
+  at some recall cost and heavier training requirements.
+
+Usage:
+    python build_index.py [--quant {sq8,pq}]
+"""
+
+import os
+import json
+import argparse
+import numpy as np
+import faiss
+from dotenv import load_dotenv
+
+load_dotenv()
+
+INDEX_PATH = "./knowledge_base/faiss_index"
+
+# IVF parameters: nlist Voronoi cells (scaled down for small corpora),
+# and for PQ, m sub-quantizers of nbits each. Quantizer training wants a
+# few hundred vectors minimum; below that the flat index is both faster
+# and exact, so we keep it.
+NLIST = 100
+PQ_M = 16
+PQ_NBITS = 8
+MIN_VECTORS_FOR_IVF = 256
+
+
+def build_quantized_index(vectors: np.ndarray, d: int, nlist: int, quant: str):
+    """Build a trained IVF index over `vectors` using the chosen codec."""
+    quantizer = faiss.IndexFlatL2(d)
+    if quant == "pq":
+        print(f"🔨 Building IVF+PQ index (nlist={nlist}, m={PQ_M}, nbits={PQ_NBITS})...")
+        index = faiss.IndexIVFPQ(quantizer, d, nlist, PQ_M, PQ_NBITS)
+    else:
+        print(f"🔨 Building IVF+SQ8 index (nlist={nlist}, int8 scalar quantization)...")
+        index = faiss.IndexIVFScalarQuantizer(
+            quantizer, d, nlist, faiss.ScalarQuantizer.QT_8bit
+        )
+
+    index.train(vectors)
+    index.add(vectors)
+    index.nprobe = 8
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild FAISS index with IVF + quantization")
+    parser.add_argument(
+        "--quant",
+        choices=["sq8", "pq"],
+        default="sq8",
+        help="Vector codec: int8 scalar quantization (default) or product quantization"
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(INDEX_PATH):
+        print(f"❌ No knowledge base found at {INDEX_PATH}")
+        print("Run create_finance_knowledge_base.py first.")
+        return
+
+    print(f"📚 Loading knowledge base from {INDEX_PATH}...")
+    index_file = os.path.join(INDEX_PATH, "index.faiss")
+    docstore_file = os.path.join(INDEX_PATH, "docstore.jsonl")
+
+    if os.path.exists(docstore_file):
+        # Split format written by create_finance_knowledge_base.py: the
+        # docstore is untouched here, so only the raw index needs reading
+        flat_index = faiss.read_index(index_file)
+        legacy_db = None
+    else:
+        # Legacy pickled save_local format - migrate to the split format
+        # on the way out so the loader can mmap the rebuilt index
+        from langchain_openai import OpenAIEmbeddings
+        from langchain_community.vectorstores import FAISS
+
+        embeddings = OpenAIEmbeddings(api_key=os.getenv("OPENAI_API_KEY"))
+        legacy_db = FAISS.load_local(
+            INDEX_PATH,
+            embeddings,
+            allow_dangerous_deserialization=True
+        )
+        flat_index = legacy_db.index
+
+    n = flat_index.ntotal
+    d = flat_index.d
+    print(f"📊 Loaded {n} vectors of dimension {d}")
+
+    if n < MIN_VECTORS_FOR_IVF:
+        print(f"⚠️  Only {n} vectors (< {MIN_VECTORS_FOR_IVF}) - keeping flat index.")
+        print("Quantizer training needs more data than this corpus provides;")
+        print("rerun after the knowledge base grows.")
+        return
+
+    # Pull the raw vectors back out of the flat index
+    vectors = flat_index.reconstruct_n(0, n)
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+    # Scale nlist down for small corpora (FAISS wants >= ~39*nlist training points)
+    nlist = min(NLIST, max(1, n // 39))
+
+    index = build_quantized_index(vectors, d, nlist, args.quant)
+
+    # Persist in the split format: raw index via faiss.write_index, with
+    # the JSONL docstore alongside (no index.pkl involved)
+    faiss.write_index(index, index_file)
+    if legacy_db is not None:
+        # Convert the pickled docstore to docstore.jsonl once; vector
+        # order is unchanged, so ids map straight through
+        with open(docstore_file, "w", encoding="utf-8") as f:
+            for i in range(n):
+                doc_id = legacy_db.index_to_docstore_id[i]
+                doc = legacy_db.docstore.search(doc_id)
+                f.write(json.dumps(
+                    {"id": i, "text": doc.page_content, "metadata": doc.metadata}
+                ) + "\n")
+        pkl_file = os.path.join(INDEX_PATH, "index.pkl")
+        if os.path.exists(pkl_file):
+            os.remove(pkl_file)
+
+    print(f"✅ Quantized index ({args.quant}) built and saved to {INDEX_PATH}")
+    print(f"📊 Total vectors: {index.ntotal}")
+
+
+if __name__ == "__main__":
+    main()
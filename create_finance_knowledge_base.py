@@ -10,15 +10,122 @@ Builds a FAISS vector database with comprehensive financial knowledge including:
 """
 
 import os
+import re
+import json
+import hashlib
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import faiss
+import openai
+import tiktoken
+import numpy as np
 from dotenv import load_dotenv
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import FAISS
+from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.vectorstores.utils import DistanceStrategy
 from langchain_core.documents import Document
 
 load_dotenv()
 
-# Initialize embeddings
-embeddings = OpenAIEmbeddings(api_key=os.getenv("OPENAI_API_KEY"))
+class NormalizedOpenAIEmbeddings(OpenAIEmbeddings):
+    """
+    OpenAIEmbeddings whose query vectors are explicitly L2-normalized.
+
+    The index stores normalized document vectors under an inner-product
+    metric (see below), so queries must be normalized the same way for
+    the scores to be cosine similarities.
+    """
+
+    def embed_query(self, text):
+        vec = np.asarray(super().embed_query(text), dtype=np.float32)
+        vec /= max(float(np.linalg.norm(vec)), 1e-12)
+        return vec.tolist()
+
+
+# Initialize embeddings. text-embedding-3-small is cheaper than the old
+# ada-002 default and supports Matryoshka truncation: 512 dims keeps
+# nearly all recall on short documents like these at a third of the
+# bytes per vector (less RAM, less bandwidth on every search).
+# chunk_size controls how many inputs LangChain puts in one API request;
+# 96 keeps a corpus this size down to a request or two.
+embeddings = NormalizedOpenAIEmbeddings(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    model="text-embedding-3-small",
+    dimensions=512,
+    chunk_size=96,
+    max_retries=6,
+    request_timeout=30
+)
+EMBEDDING_MODEL = embeddings.model
+
+# Cache embeddings on disk keyed by content hash, so rebuilding the
+# knowledge base only pays the API for documents that actually changed
+# (optional — same graceful fallback as the app's loader)
+try:
+    from langchain.embeddings import CacheBackedEmbeddings
+    from langchain.storage import LocalFileStore
+
+    _store = LocalFileStore("./knowledge_base/emb_cache")
+    embeddings = CacheBackedEmbeddings.from_bytes_store(
+        embeddings,
+        _store,
+        namespace=EMBEDDING_MODEL,
+        query_embedding_cache=True
+    )
+    print("✅ Embedding cache enabled (./knowledge_base/emb_cache)")
+except ImportError:
+    print("⚠️  CacheBackedEmbeddings unavailable - rebuilds will re-embed everything")
+
+# OpenAI embedding API limits: total tokens per request (kept below the
+# documented 300k with headroom) and tokens per individual input
+MAX_TOKENS_PER_REQUEST = 250_000
+MAX_TOKENS_PER_INPUT = 8191
+
+# Compiled once: strip the indentation around newlines that triple-quoted
+# literals carry, then collapse runs of spaces — keeps the line structure
+# (markdown bullets) while dropping the tokens that only pad the source
+_WS = re.compile(r"[ \t]*\n[ \t]*")
+_MULTISPACE = re.compile(r" {2,}")
+
+
+def clean_text(text):
+    """Collapse literal indentation and repeated spaces in one pass each."""
+    return _MULTISPACE.sub(" ", _WS.sub("\n", text)).strip()
+
+
+def batch_by_tokens(texts):
+    """
+    Greedily pack texts into batches that respect the embedding API's
+    token limits, so each batch goes out as one HTTP request.
+
+    Over-long texts (beyond the per-input limit) are dropped with a
+    warning rather than silently truncated.
+
+    Returns:
+        Tuple of (list of batches, indices of the texts that were kept)
+    """
+    encoding = tiktoken.encoding_for_model(EMBEDDING_MODEL)
+
+    batches = []
+    kept_indices = []
+    current, current_tokens = [], 0
+    for i, text in enumerate(texts):
+        n_tokens = len(encoding.encode(text))
+        if n_tokens > MAX_TOKENS_PER_INPUT:
+            print(f"⚠️  Skipping document {i}: {n_tokens} tokens exceeds per-input limit")
+            continue
+        if current and current_tokens + n_tokens > MAX_TOKENS_PER_REQUEST:
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += n_tokens
+        kept_indices.append(i)
+    if current:
+        batches.append(current)
+    return batches, kept_indices
 
 # ==================== KNOWLEDGE BASE CONTENT ====================
 
@@ -538,30 +645,148 @@ financial_planning = [
     """,
 ]
 
-# Combine all content
-all_documents = (
-    financial_concepts + 
-    investment_strategies + 
-    tax_concepts + 
-    market_indicators + 
+# Combine all content lazily — chain iterates the category lists in place
+# instead of allocating a concatenated copy (matters as content grows)
+all_documents = itertools.chain(
+    financial_concepts,
+    investment_strategies,
+    tax_concepts,
+    market_indicators,
     financial_planning
 )
 
-# Create Document objects
-documents = [
-    Document(page_content=content.strip(), metadata={"source": "finance_knowledge"})
-    for content in all_documents
-]
+# Canonicalize whitespace once (triple-quoted literals carry heavy
+# indentation that inflates billed tokens), deduplicate identical blocks
+# by content hash, and keep the hash as a stable doc_id so cached
+# embeddings can be reused across rebuilds
+seen = set()
+documents = []
+for content in all_documents:
+    text = clean_text(content)
+    digest = hashlib.sha1(text.encode()).hexdigest()
+    if digest in seen:
+        continue
+    seen.add(digest)
+    documents.append(Document(
+        page_content=text,
+        metadata={"source": "finance_knowledge", "doc_id": digest}
+    ))
 
 print(f"📚 Creating knowledge base with {len(documents)} documents...")
 
-# Create FAISS vector store
-db = FAISS.from_documents(documents, embeddings)
+# Embed in explicit token-aware batches (one API request per batch) and
+# build the index from the precomputed vectors so nothing is embedded twice
+texts = [doc.page_content for doc in documents]
+batches, kept_indices = batch_by_tokens(texts)
+print(f"🔢 Embedding {len(kept_indices)} documents in {len(batches)} API batch(es)...")
+
+@retry(
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(6),
+    retry=retry_if_exception_type(openai.RateLimitError)
+)
+def embed_batch(batch):
+    """Embed one batch, backing off on 429s rather than failing the build."""
+    return embeddings.embed_documents(batch)
+
+
+# Fire batch requests concurrently — the build is dominated by API
+# round-trips, so overlapping them saturates the rate limit instead of
+# serializing on it. executor.map preserves batch order.
+with ThreadPoolExecutor(max_workers=8) as executor:
+    vectors = [
+        vector
+        for batch_vectors in executor.map(embed_batch, batches)
+        for vector in batch_vectors
+    ]
+
+kept_texts = [texts[i] for i in kept_indices]
+metadatas = [documents[i].metadata for i in kept_indices]
 
-# Save to disk
+# Pre-allocate the matrix C-contiguous float32 and fill it row by row:
+# converting the Python lists via asarray can produce an intermediate
+# copy, and FAISS's SIMD kernels want aligned contiguous input for add()
+n = len(vectors)
+d = len(vectors[0])
+arr = np.empty((n, d), dtype=np.float32)
+for i, vector in enumerate(vectors):
+    arr[i] = vector
+assert arr.flags.c_contiguous
+
+# One vectorized pass normalizes every row, making the inner-product
+# metric below exact cosine similarity (no per-query sqrt/subtract work)
+arr /= np.linalg.norm(arr, axis=1, keepdims=True).clip(1e-12)
+
+# Faiss decision tree: HNSW graph search for small corpora (near-exact
+# recall), IVF+PQ once there are enough vectors to train codebooks —
+# sub-linear search and ~16x less memory. The HNSW vectors are stored
+# int8 scalar-quantized (SQ8): a quarter of the FP32 bytes per vector,
+# scanned with SIMD int8 kernels, with negligible recall loss at this
+# dimensionality. Inner product on (unit-norm) OpenAI vectors is cosine.
+if len(arr) < 10_000:
+    index = faiss.index_factory(d, "HNSW32_SQ8", faiss.METRIC_INNER_PRODUCT)
+    index.train(arr)  # SQ8 learns per-dimension scale ranges
+else:
+    # OPQ learns a rotation at train time that minimizes PQ quantization
+    # error — better recall at the same code size, for one extra matmul
+    # per query (negligible next to the PQ scan it improves)
+    index = faiss.index_factory(d, "OPQ32_128,IVF64,PQ32x8", faiss.METRIC_INNER_PRODUCT)
+    index.train(arr)
+    # The OPQ wrapper (IndexPreTransform) hides the IVF layer, so nprobe
+    # has to be set on the extracted inner index
+    faiss.extract_index_ivf(index).nprobe = 8
+index.add(arr)
+
+docstore = InMemoryDocstore({
+    str(i): Document(page_content=text, metadata=metadata)
+    for i, (text, metadata) in enumerate(zip(kept_texts, metadatas))
+})
+db = FAISS(
+    embedding_function=embeddings,
+    index=index,
+    docstore=docstore,
+    index_to_docstore_id={i: str(i) for i in range(len(kept_texts))},
+    distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+)
+
+# Save to disk in split form: the raw index via faiss.write_index (so the
+# loader can memory-map it read-only and share pages across processes) and
+# the docstore as JSONL — no pickle, portable, line-per-document
 output_path = "./knowledge_base/faiss_index"
 os.makedirs(output_path, exist_ok=True)
-db.save_local(output_path)
+faiss.write_index(db.index, os.path.join(output_path, "index.faiss"))
+with open(os.path.join(output_path, "docstore.jsonl"), "w", encoding="utf-8") as f:
+    for i, (text, metadata) in enumerate(zip(kept_texts, metadatas)):
+        f.write(json.dumps({"id": i, "text": text, "metadata": metadata}) + "\n")
+
+# Also persist the raw normalized matrix for the NumPy brute-force
+# retriever (numpy_retriever.py) — at this corpus size one BLAS matvec
+# over emb.npy beats a FAISS round-trip entirely
+np.save(os.path.join(output_path, "emb.npy"), arr)
+
+# Columnar Arrow/Parquet copy of (text, metadata, vector): an SoA layout
+# that's zero-copy mmap-readable and queryable from DuckDB/Polars without
+# any Python-side deserialization (optional)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    table = pa.table({
+        "text": pa.array(kept_texts, type=pa.large_utf8()),
+        "source": pa.array([m.get("source", "") for m in metadatas]).dictionary_encode(),
+        "doc_id": [m.get("doc_id", "") for m in metadatas],
+        "vector": pa.FixedSizeListArray.from_arrays(
+            pa.array(arr.astype(np.float16).reshape(-1)), d
+        )
+    })
+    pq.write_table(
+        table,
+        os.path.join(output_path, "embeddings.parquet"),
+        compression="zstd"
+    )
+    print("✅ Columnar copy written (embeddings.parquet)")
+except ImportError:
+    print("⚠️  pyarrow not installed - skipping Parquet export")
 
 print(f"✅ Knowledge base created successfully!")
 print(f"📁 Saved to: {output_path}")
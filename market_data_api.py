@@ -6,18 +6,131 @@ for fetching stock quotes, historical data, and market information.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import threading
 import time
+import numpy as np
 import yfinance as yf
+from collections import OrderedDict
+from dataclasses import dataclass, fields
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
 import logging
 
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
 logger = logging.getLogger(__name__)
 
+# Static symbol index for the common tickers this assistant deals with
+# (trending universe, major indices, household names). Lookups against it
+# are pure in-memory work; yfinance is only consulted on a miss.
+_SYMBOL_TABLE = {
+    'AAPL': ('Apple Inc.', 'EQUITY', 'NMS'),
+    'MSFT': ('Microsoft Corporation', 'EQUITY', 'NMS'),
+    'GOOGL': ('Alphabet Inc.', 'EQUITY', 'NMS'),
+    'AMZN': ('Amazon.com, Inc.', 'EQUITY', 'NMS'),
+    'TSLA': ('Tesla, Inc.', 'EQUITY', 'NMS'),
+    'NVDA': ('NVIDIA Corporation', 'EQUITY', 'NMS'),
+    'META': ('Meta Platforms, Inc.', 'EQUITY', 'NMS'),
+    'BRK-B': ('Berkshire Hathaway Inc.', 'EQUITY', 'NYQ'),
+    'JPM': ('JPMorgan Chase & Co.', 'EQUITY', 'NYQ'),
+    'V': ('Visa Inc.', 'EQUITY', 'NYQ'),
+    'NFLX': ('Netflix, Inc.', 'EQUITY', 'NMS'),
+    'AMD': ('Advanced Micro Devices, Inc.', 'EQUITY', 'NMS'),
+    'INTC': ('Intel Corporation', 'EQUITY', 'NMS'),
+    'DIS': ('The Walt Disney Company', 'EQUITY', 'NYQ'),
+    'KO': ('The Coca-Cola Company', 'EQUITY', 'NYQ'),
+    'PEP': ('PepsiCo, Inc.', 'EQUITY', 'NMS'),
+    'WMT': ('Walmart Inc.', 'EQUITY', 'NYQ'),
+    'BAC': ('Bank of America Corporation', 'EQUITY', 'NYQ'),
+    'XOM': ('Exxon Mobil Corporation', 'EQUITY', 'NYQ'),
+    'UNH': ('UnitedHealth Group Incorporated', 'EQUITY', 'NYQ'),
+    'SPY': ('SPDR S&P 500 ETF Trust', 'ETF', 'PCX'),
+    'QQQ': ('Invesco QQQ Trust', 'ETF', 'NMS'),
+    'VTI': ('Vanguard Total Stock Market ETF', 'ETF', 'PCX'),
+    'VOO': ('Vanguard S&P 500 ETF', 'ETF', 'PCX'),
+    '^GSPC': ('S&P 500', 'INDEX', 'SNP'),
+    '^DJI': ('Dow Jones Industrial Average', 'INDEX', 'DJI'),
+    '^IXIC': ('NASDAQ Composite', 'INDEX', 'NIM'),
+    '^RUT': ('Russell 2000', 'INDEX', 'WCB'),
+}
+
+
+@dataclass(slots=True, frozen=True)
+class QuoteRecord:
+    """Compact cached representation of one stock quote.
+
+    A slotted record carries the same nine fields as the response dict
+    at a fraction of the per-entry overhead, which matters when the cache
+    holds hundreds of quotes. Values may be numbers or 'N/A'.
+    """
+    symbol: str
+    name: str
+    price: Any
+    change: Any
+    change_percent: Any
+    previous_close: Any
+    market_cap: Any
+    pe_ratio: Any
+    timestamp: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Expand to the plain dict callers expect at the API boundary"""
+        return {name: getattr(self, name) for name in _QUOTE_FIELDS}
+
+
+_QUOTE_FIELDS = tuple(f.name for f in fields(QuoteRecord))
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: bursts up to capacity, refills at rate/sec.
+
+    Unlike a fixed inter-request delay, callers only sleep when the burst
+    budget is actually spent, so a batch of K requests takes max(0, (K -
+    capacity) / rate) seconds instead of K * interval.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping only when the bucket is empty."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            logger.debug("Rate limiting: sleeping %.2fs", wait)
+            time.sleep(wait)
+
 
 class MarketDataAPI:
     """Wrapper for market data API calls using Alpha Vantage and yFinance"""
-    
+
+    # Fixed attribute set: skips the per-instance __dict__ and makes
+    # attribute access a slot-descriptor read
+    __slots__ = ('alpha_vantage_key', 'alpha_vantage_base', 'session',
+                 '_bucket', 'cache', '_cache_lock', 'max_cache_size',
+                 'cache_duration', 'info_cache_duration',
+                 'historical_cache_duration', 'disk_cache')
+
     def __init__(self, alpha_vantage_key: Optional[str] = None):
         """
         Initialize Market Data API client
@@ -27,40 +140,238 @@ class MarketDataAPI:
         """
         self.alpha_vantage_key = alpha_vantage_key
         self.alpha_vantage_base = "https://www.alphavantage.co/query"
-        
-        # Rate limiting for both APIs
-        self.last_request_time = 0
-        self.min_request_interval = 3  # 3 seconds between yFinance requests to avoid 429
-        
-        # Cache for recent requests to reduce API calls
-        self.cache = {}
+
+        # Shared session with connection pooling: reusing TCP+TLS
+        # connections avoids a fresh handshake per request, and the retry
+        # policy absorbs transient 429/5xx responses with backoff. With
+        # requests-cache installed, the session also honors server cache
+        # headers (ETag conditional GETs) and serves stale bodies when the
+        # provider answers 429/5xx.
+        if CachedSession is not None:
+            self.session = CachedSession(
+                '.rc_cache', backend='sqlite', expire_after=300,
+                cache_control=True, stale_if_error=True)
+            logger.info("✅ HTTP response cache enabled")
+        else:
+            self.session = requests.Session()
+        self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504]
+        )
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=4, pool_maxsize=32, max_retries=retry))
+
+        # Rate limiting for both APIs: allow short bursts, then pace at a
+        # steady rate instead of forcing a fixed gap between every request
+        self._bucket = _TokenBucket(rate=2.0, capacity=5)
+
+        # LRU cache for recent requests to reduce API calls; bounded so
+        # long-running sessions with many symbols can't grow without limit
+        self.cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self.max_cache_size = 512
         self.cache_duration = 300  # Cache data for 5 minutes (300 seconds)
+        self.info_cache_duration = 3600  # Company metadata changes rarely
+        self.historical_cache_duration = 86400  # Closed candles don't change
+
+        # Optional SQLite-backed cache: survives restarts and is shared
+        # across worker processes, so a redeploy doesn't burn rate budget
+        # re-fetching everything. Falls back to memory-only when diskcache
+        # isn't installed.
+        self.disk_cache = None
+        if diskcache is not None:
+            try:
+                self.disk_cache = diskcache.Cache(
+                    './.market_cache', size_limit=256 * 1024 * 1024)
+                logger.info("✅ Persistent market data cache enabled")
+            except Exception as e:
+                logger.warning("⚠️ Could not open disk cache: %s", e)
         
         logger.info("MarketDataAPI initialized")
     
     def _rate_limit(self):
         """Implement rate limiting to avoid 429 errors"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last
-            logger.debug(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
-    
+        self._bucket.acquire()
+
     def _get_from_cache(self, cache_key: str) -> Optional[Any]:
-        """Get data from cache if available and not expired"""
-        if cache_key in self.cache:
-            cached_data, timestamp = self.cache[cache_key]
-            if time.time() - timestamp < self.cache_duration:
-                logger.debug(f"Cache hit for {cache_key}")
+        """Get data from cache if available and not expired.
+
+        The lookup itself is lock-free (a single dict read is atomic under
+        the GIL); only the LRU reorder and eviction — the mutations that
+        can race with concurrent callers — take the short cache lock.
+        """
+        entry = self.cache.get(cache_key)
+        if entry is not None:
+            cached_data, timestamp, ttl = entry
+            if time.time() - timestamp < ttl:
+                logger.debug("Cache hit for %s", cache_key)
+                with self._cache_lock:
+                    if cache_key in self.cache:
+                        self.cache.move_to_end(cache_key)
                 return cached_data
+            # Expired entries are evicted eagerly instead of lingering
+            with self._cache_lock:
+                self.cache.pop(cache_key, None)
+
+        if self.disk_cache is not None:
+            try:
+                data = self.disk_cache.get(cache_key)
+            except Exception as e:
+                logger.debug("Disk cache read failed for %s: %s", cache_key, e)
+                data = None
+            if data is not None:
+                logger.debug("Disk cache hit for %s", cache_key)
+                return data
         return None
-    
-    def _save_to_cache(self, cache_key: str, data: Any):
-        """Save data to cache with timestamp"""
-        self.cache[cache_key] = (data, time.time())
-    
+
+    def _save_to_cache(self, cache_key: str, data: Any, ttl: Optional[int] = None):
+        """Save data to cache with timestamp, evicting least-recently-used"""
+        ttl = ttl or self.cache_duration
+        with self._cache_lock:
+            self.cache[cache_key] = (data, time.time(), ttl)
+            self.cache.move_to_end(cache_key)
+            while len(self.cache) > self.max_cache_size:
+                self.cache.popitem(last=False)
+
+        if self.disk_cache is not None:
+            try:
+                self.disk_cache.set(cache_key, data, expire=ttl)
+            except Exception as e:
+                logger.debug("Disk cache write failed for %s: %s", cache_key, e)
+
+    def _get_info(self, symbol: str) -> Dict[str, Any]:
+        """
+        Fetch ticker.info for a symbol, memoized for an hour.
+
+        Every .info access is its own HTTP round trip (and the one most
+        prone to 429s), so quote, company-info and symbol-search paths all
+        share this single cached fetch per symbol.
+        """
+        cache_key = f"info_{symbol.upper()}"
+        cached = self._get_from_cache(cache_key)
+        if cached is not None:
+            return cached
+
+        self._rate_limit()
+        info = yf.Ticker(symbol, session=self.session).info
+        self._save_to_cache(cache_key, info, ttl=self.info_cache_duration)
+        return info
+
+    def _build_quote(self, symbol: str, current_price: float,
+                     previous_close: Optional[float], name: Optional[str] = None,
+                     market_cap: Any = 'N/A', pe_ratio: Any = 'N/A',
+                     timestamp: Optional[str] = None) -> QuoteRecord:
+        """Build the quote record shared by the single and batch fetch paths"""
+        change = current_price - previous_close if previous_close else 0
+        change_percent = (change / previous_close) * 100 if previous_close else 0
+        return QuoteRecord(
+            symbol=symbol.upper(),
+            name=name or symbol,
+            price=round(float(current_price), 2),
+            change=round(float(change), 2),
+            change_percent=round(float(change_percent), 2),
+            previous_close=round(float(previous_close), 2) if previous_close else 'N/A',
+            market_cap=market_cap,
+            pe_ratio=pe_ratio,
+            timestamp=timestamp or time.strftime('%Y-%m-%d %H:%M:%S')
+        )
+
+    def get_stock_quotes_batch(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get quotes for several symbols with a single multi-ticker download.
+
+        Cached symbols are served from the LRU; the misses are packed into
+        one yf.download call instead of one HTTP request per symbol, which
+        also sidesteps most per-request 429s.
+
+        Args:
+            symbols: Stock ticker symbols to fetch
+
+        Returns:
+            Dictionary mapping each symbol to its quote data (symbols with
+            no data are omitted)
+        """
+        results = {}
+        missing = []
+        for symbol in symbols:
+            cached = self._get_from_cache(f"quote_{symbol}")
+            if cached:
+                results[symbol] = cached.as_dict()
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return results
+
+        logger.info("Batch fetching quotes for %s symbols", len(missing))
+        self._rate_limit()
+
+        # One timestamp for the whole batch; strftime per quote adds up
+        # when building hundreds of dicts
+        ts = time.strftime('%Y-%m-%d %H:%M:%S')
+
+        try:
+            data = yf.download(
+                " ".join(missing), period="5d", group_by='ticker',
+                threads=True, progress=False, session=self.session)
+        except Exception as e:
+            logger.error("❌ Batch quote download failed: %s", e)
+            return results
+
+        extracted = []
+        for symbol in missing:
+            try:
+                hist = data[symbol] if len(missing) > 1 else data
+                closes = hist['Close'].dropna()
+                if closes.empty:
+                    logger.warning("No batch data for %s", symbol)
+                    continue
+                current_price = float(closes.iloc[-1])
+                if len(closes) > 1:
+                    previous_close = float(closes.iloc[-2])
+                else:
+                    previous_close = float(hist['Open'].dropna().iloc[-1])
+            except Exception as e:
+                logger.debug("Could not extract batch quote for %s: %s", symbol, e)
+                continue
+            extracted.append((symbol, current_price, previous_close))
+
+        if extracted:
+            # Round all prices/changes in one vectorized pass instead of
+            # four Python-level round(float(...)) calls per symbol
+            current = np.array([cur for _, cur, _ in extracted])
+            previous = np.array([prev for _, _, prev in extracted])
+            change = current - previous
+            change_percent = np.divide(
+                change, previous, out=np.zeros_like(change),
+                where=previous != 0) * 100
+            rounded = np.round(
+                np.column_stack((current, change, change_percent, previous)),
+                2).tolist()
+
+            for (symbol, _, _), (price, chg, chg_pct, prev) in zip(extracted, rounded):
+                record = QuoteRecord(
+                    symbol=symbol.upper(),
+                    name=symbol,
+                    price=price,
+                    change=chg,
+                    change_percent=chg_pct,
+                    previous_close=prev,
+                    market_cap='N/A',
+                    pe_ratio='N/A',
+                    timestamp=ts
+                )
+                self._save_to_cache(f"quote_{symbol}", record)
+                results[symbol] = record.as_dict()
+
+        logger.info("✅ Batch fetched %s/%s quotes", len(results), len(symbols))
+        return results
+
     def get_stock_quote(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
         Get real-time stock quote for a symbol
@@ -71,21 +382,21 @@ class MarketDataAPI:
         Returns:
             Dictionary with stock quote data or None if failed
         """
-        logger.info(f"Fetching stock quote for {symbol}")
+        logger.info("Fetching stock quote for %s", symbol)
         
         # Check cache first
         cache_key = f"quote_{symbol}"
         cached_data = self._get_from_cache(cache_key)
         if cached_data:
-            logger.info(f"✅ Returning cached quote for {symbol}")
-            return cached_data
-        
+            logger.info("✅ Returning cached quote for %s", symbol)
+            return cached_data.as_dict()
+
         # Rate limit to avoid 429 errors
         self._rate_limit()
         
         try:
             # Use yFinance as primary source
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self.session)
             
             current_price = None
             previous_close = None
@@ -102,9 +413,9 @@ class MarketDataAPI:
                         previous_close = float(hist['Close'].iloc[-2])
                     else:
                         previous_close = float(hist['Open'].iloc[-1])
-                    logger.debug(f"Got price from history for {symbol}: ${current_price}")
+                    logger.debug("Got price from history for %s: $%s", symbol, current_price)
             except Exception as hist_error:
-                logger.debug(f"History method failed for {symbol}: {hist_error}")
+                logger.debug("History method failed for %s: %s", symbol, hist_error)
             
             # Method 2: Try fast_info if history failed
             if current_price is None or current_price == 0:
@@ -113,13 +424,13 @@ class MarketDataAPI:
                     current_price = float(fast_info.get('last_price', 0))
                     previous_close = float(fast_info.get('previous_close', current_price))
                     if current_price > 0:
-                        logger.debug(f"Got price from fast_info for {symbol}: ${current_price}")
+                        logger.debug("Got price from fast_info for %s: $%s", symbol, current_price)
                 except Exception as fast_error:
-                    logger.debug(f"Fast info method failed for {symbol}: {fast_error}")
+                    logger.debug("Fast info method failed for %s: %s", symbol, fast_error)
             
             # If we still don't have a valid price, return error
             if current_price is None or current_price == 0:
-                logger.warning(f"Could not fetch valid price for {symbol}")
+                logger.warning("Could not fetch valid price for %s", symbol)
                 return {
                     'symbol': symbol.upper(),
                     'name': symbol,
@@ -127,42 +438,30 @@ class MarketDataAPI:
                     'change': 'N/A',
                     'change_percent': 'N/A',
                     'error': 'Real-time data temporarily unavailable. The data provider may be rate-limiting requests. Please try again in a moment.',
-                    'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
                 }
             
-            # Calculate change
-            change = current_price - previous_close if previous_close else 0
-            change_percent = (change / previous_close) * 100 if previous_close and previous_close != 0 else 0
-            
             # Try to get additional info (with error handling for 429)
             try:
-                info = ticker.info
+                info = self._get_info(symbol)
                 name = info.get('longName', symbol)
                 market_cap = info.get('marketCap', 'N/A')
                 pe_ratio = info.get('trailingPE', 'N/A')
             except Exception as info_error:
-                logger.debug(f"Could not fetch detailed info for {symbol}: {info_error}")
-            
-            quote_data = {
-                'symbol': symbol.upper(),
-                'name': name,
-                'price': round(float(current_price), 2),
-                'change': round(float(change), 2),
-                'change_percent': round(float(change_percent), 2),
-                'previous_close': round(float(previous_close), 2) if previous_close else 'N/A',
-                'market_cap': market_cap,
-                'pe_ratio': pe_ratio,
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            }
-            
-            # Cache the result
-            self._save_to_cache(cache_key, quote_data)
-            
-            logger.info(f"✅ Successfully fetched quote for {symbol}: ${quote_data['price']}")
-            return quote_data
+                logger.debug("Could not fetch detailed info for %s: %s", symbol, info_error)
+
+            record = self._build_quote(
+                symbol, current_price, previous_close,
+                name=name, market_cap=market_cap, pe_ratio=pe_ratio)
+
+            # Cache the compact record; dicts only exist at the boundary
+            self._save_to_cache(cache_key, record)
+
+            logger.info("✅ Successfully fetched quote for %s: $%s", symbol, record.price)
+            return record.as_dict()
             
         except Exception as e:
-            logger.error(f"❌ Error fetching quote for {symbol}: {e}")
+            logger.error("❌ Error fetching quote for %s: %s", symbol, e)
             # Return a minimal fallback response
             return {
                 'symbol': symbol.upper(),
@@ -171,62 +470,87 @@ class MarketDataAPI:
                 'change': 'N/A',
                 'change_percent': 'N/A',
                 'error': 'Real-time data temporarily unavailable. The data provider may be experiencing high traffic. Please try again shortly.',
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
             }
             return None
     
-    def get_historical_data(self, symbol: str, period: str = "1mo") -> Optional[Dict[str, Any]]:
+    def get_historical_data(self, symbol: str, period: str = "1mo",
+                            include_raw: bool = False) -> Optional[Dict[str, Any]]:
         """
         Get historical price data for a symbol
-        
+
         Args:
             symbol: Stock ticker symbol
             period: Time period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
-            
+            include_raw: Whether to include per-day price/volume columns
+                (off by default; a 5y frame expands to thousands of Python
+                objects that most callers never read)
+
         Returns:
             Dictionary with historical data or None if failed
         """
-        logger.info(f"Fetching historical data for {symbol} ({period})")
-        
+        logger.info("Fetching historical data for %s (%s)", symbol, period)
+
+        # Aggregates over closed candles are stable, so they cache for a
+        # day; the raw-rows variant stays uncached
+        cache_key = f"hist_{symbol}_{period}"
+        if not include_raw:
+            cached_data = self._get_from_cache(cache_key)
+            if cached_data:
+                logger.info("✅ Returning cached historical data for %s", symbol)
+                return cached_data
+
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self.session)
             hist = ticker.history(period=period)
-            
+
             if hist.empty:
-                logger.warning(f"No historical data for {symbol}")
+                logger.warning("No historical data for %s", symbol)
                 return None
-            
-            # Calculate statistics
+
+            # Endpoints are O(1) positional reads; the three real
+            # reductions run as one vectorized aggregation pass
+            stats = hist.agg({'High': 'max', 'Low': 'min', 'Volume': 'mean'}).round(2)
             current_price = hist['Close'].iloc[-1]
-            period_high = hist['High'].max()
-            period_low = hist['Low'].min()
             period_start = hist['Close'].iloc[0]
             period_change = current_price - period_start
             period_change_percent = (period_change / period_start) * 100
-            
-            avg_volume = hist['Volume'].mean()
-            
+
             historical_data = {
                 'symbol': symbol.upper(),
                 'period': period,
                 'current_price': round(current_price, 2),
-                'period_high': round(period_high, 2),
-                'period_low': round(period_low, 2),
+                'period_high': float(stats['High']),
+                'period_low': float(stats['Low']),
                 'period_start_price': round(period_start, 2),
                 'period_change': round(period_change, 2),
                 'period_change_percent': round(period_change_percent, 2),
-                'average_volume': int(avg_volume),
+                'average_volume': int(stats['Volume']),
                 'data_points': len(hist),
                 'start_date': hist.index[0].strftime('%Y-%m-%d'),
                 'end_date': hist.index[-1].strftime('%Y-%m-%d'),
-                'raw_data': hist.to_dict('index')  # Full historical data
             }
-            
-            logger.info(f"✅ Successfully fetched {len(hist)} data points for {symbol}")
+
+            if include_raw:
+                # Columnar lists serialize far more compactly than the old
+                # per-row dict-of-dicts
+                historical_data['raw_data'] = {
+                    'dates': hist.index.strftime('%Y-%m-%d').tolist(),
+                    'open': hist['Open'].round(2).tolist(),
+                    'close': hist['Close'].round(2).tolist(),
+                    'high': hist['High'].round(2).tolist(),
+                    'low': hist['Low'].round(2).tolist(),
+                    'volume': hist['Volume'].astype('int64').tolist(),
+                }
+            else:
+                self._save_to_cache(cache_key, historical_data,
+                                    ttl=self.historical_cache_duration)
+
+            logger.info("✅ Successfully fetched %s data points for %s", len(hist), symbol)
             return historical_data
-            
+
         except Exception as e:
-            logger.error(f"❌ Error fetching historical data for {symbol}: {e}")
+            logger.error("❌ Error fetching historical data for %s: %s", symbol, e)
             return None
     
     def get_company_info(self, symbol: str) -> Optional[Dict[str, Any]]:
@@ -239,24 +563,19 @@ class MarketDataAPI:
         Returns:
             Dictionary with company information or None if failed
         """
-        logger.info(f"Fetching company info for {symbol}")
+        logger.info("Fetching company info for %s", symbol)
         
         # Check cache first
         cache_key = f"company_{symbol}"
         cached_data = self._get_from_cache(cache_key)
         if cached_data:
-            logger.info(f"✅ Returning cached company info for {symbol}")
+            logger.info("✅ Returning cached company info for %s", symbol)
             return cached_data
         
-        # Rate limit to avoid 429 errors
-        self._rate_limit()
-        
         try:
-            ticker = yf.Ticker(symbol)
-            
             # Try to get basic info with error handling
             try:
-                info = ticker.info
+                info = self._get_info(symbol)
                 company_data = {
                     'symbol': symbol.upper(),
                     'name': info.get('longName', symbol),
@@ -274,7 +593,7 @@ class MarketDataAPI:
                     '52_week_low': info.get('fiftyTwoWeekLow', 'N/A'),
                 }
             except Exception as info_error:
-                logger.warning(f"Could not fetch detailed company info for {symbol}: {info_error}")
+                logger.warning("Could not fetch detailed company info for %s: %s", symbol, info_error)
                 # Return minimal info
                 company_data = {
                     'symbol': symbol.upper(),
@@ -288,11 +607,11 @@ class MarketDataAPI:
             # Cache the result
             self._save_to_cache(cache_key, company_data)
             
-            logger.info(f"✅ Successfully fetched company info for {symbol}")
+            logger.info("✅ Successfully fetched company info for %s", symbol)
             return company_data
             
         except Exception as e:
-            logger.error(f"❌ Error fetching company info for {symbol}: {e}")
+            logger.error("❌ Error fetching company info for %s: %s", symbol, e)
             return {
                 'symbol': symbol.upper(),
                 'name': symbol,
@@ -317,9 +636,12 @@ class MarketDataAPI:
         }
         
         results = {}
-        
+
+        # One multi-ticker download covers all four indices instead of a
+        # request (and a rate-limit token) per symbol
+        quotes = self.get_stock_quotes_batch(list(indices))
         for symbol, name in indices.items():
-            quote = self.get_stock_quote(symbol)
+            quote = quotes.get(symbol)
             if quote:
                 results[name] = {
                     'symbol': symbol,
@@ -327,8 +649,8 @@ class MarketDataAPI:
                     'change': quote['change'],
                     'change_percent': quote['change_percent']
                 }
-        
-        logger.info(f"✅ Fetched data for {len(results)} indices")
+
+        logger.info("✅ Fetched data for %s indices", len(results))
         return results
     
     def search_symbols(self, query: str) -> List[Dict[str, str]]:
@@ -341,14 +663,31 @@ class MarketDataAPI:
         Returns:
             List of matching symbols with basic info
         """
-        logger.info(f"Searching symbols for query: {query}")
-        
-        # This is a simplified search - in production, use a proper search API
-        # For now, try to fetch the ticker directly
+        logger.info("Searching symbols for query: %s", query)
+
+        # Serve common tickers from the static table first: exact symbol
+        # hit, then prefix match on symbol or company name. No network I/O
+        # for the typical autocomplete query.
+        q = query.strip().upper()
+        record = _SYMBOL_TABLE.get(q)
+        if record:
+            name, quote_type, exchange = record
+            return [{'symbol': q, 'name': name, 'type': quote_type,
+                     'exchange': exchange}]
+
+        matches = [
+            {'symbol': sym, 'name': name, 'type': quote_type,
+             'exchange': exchange}
+            for sym, (name, quote_type, exchange) in _SYMBOL_TABLE.items()
+            if sym.startswith(q) or name.upper().startswith(q)
+        ]
+        if matches:
+            return matches[:10]
+
+        # Fall back to yfinance for anything outside the static table
         try:
-            ticker = yf.Ticker(query.upper())
-            info = ticker.info
-            
+            info = self._get_info(q)
+
             if 'symbol' in info:
                 return [{
                     'symbol': info.get('symbol', query.upper()),
@@ -360,9 +699,54 @@ class MarketDataAPI:
                 return []
                 
         except Exception as e:
-            logger.error(f"❌ Error searching for {query}: {e}")
+            logger.error("❌ Error searching for %s: %s", query, e)
             return []
     
+    def prefetch_trending(self, refresh_interval: Optional[float] = None) -> threading.Thread:
+        """
+        Warm the quote cache for the trending universe in the background.
+
+        A daemon thread refreshes the trending symbols' quotes just before
+        their cache entries would expire, so the UI hot path almost always
+        sees a cache hit instead of paying the batch download latency.
+
+        Args:
+            refresh_interval: Seconds between refreshes (defaults to the
+                quote TTL minus a 30s margin)
+
+        Returns:
+            The started daemon thread
+        """
+        interval = refresh_interval or max(30, self.cache_duration - 30)
+
+        def _refresh():
+            while True:
+                symbols = self.get_trending_stocks()
+                try:
+                    # Evict first so the batch path refetches instead of
+                    # treating the still-valid entries as hits; the disk
+                    # cache must go too or its entry short-circuits the probe
+                    with self._cache_lock:
+                        for symbol in symbols:
+                            self.cache.pop(f"quote_{symbol}", None)
+                    if self.disk_cache is not None:
+                        for symbol in symbols:
+                            try:
+                                self.disk_cache.delete(f"quote_{symbol}")
+                            except Exception as e:
+                                logger.debug(
+                                    "Disk cache evict failed for %s: %s", symbol, e)
+                    self.get_stock_quotes_batch(symbols)
+                except Exception as e:
+                    logger.warning("⚠️ Trending prefetch failed: %s", e)
+                time.sleep(interval)
+
+        thread = threading.Thread(
+            target=_refresh, daemon=True, name="trending-prefetch")
+        thread.start()
+        logger.info("✅ Trending prefetch started (every %.0fs)", interval)
+        return thread
+
     def get_trending_stocks(self) -> List[str]:
         """
         Get list of trending/popular stocks
@@ -377,5 +761,5 @@ class MarketDataAPI:
             'NVDA', 'META', 'BRK-B', 'JPM', 'V'
         ]
         
-        logger.info(f"Returning {len(trending)} trending stocks")
+        logger.info("Returning %s trending stocks", len(trending))
         return trending
@@ -6,29 +6,77 @@ Supports parallel agent execution for reduced latency.
 
 import asyncio
 import logging
-from typing import Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor
+import time
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 
 logger = logging.getLogger(__name__)
 
+# Synthesis prompt is identical every call apart from the query and the
+# agent responses, so the template (and the constant system message below)
+# are built once at import time
+_SYNTH_PROMPT = """You are synthesizing responses from multiple specialized financial AI agents.
+
+Original User Query: "{query}"
+
+Agent Responses:
+{responses}
+
+Instructions:
+1. Combine all agent responses into ONE comprehensive, well-organized answer
+2. Eliminate redundancy while preserving all unique information
+3. Organize information logically (e.g., data first, then analysis, then recommendations)
+4. Maintain the educational tone
+5. Keep all disclaimers about not being financial advice
+6. Use clear headings and bullet points for readability
+7. Make it feel like a single, cohesive response (not separate agent outputs)
+
+Synthesized Response:"""
+
+_SYNTH_SYSTEM_MESSAGE = SystemMessage(
+    content="You are an expert at synthesizing information from multiple "
+            "sources into clear, comprehensive responses.")
+
+# Per-agent budget for the synthesis prompt: input tokens dominate both
+# cost and time-to-first-token, and a runaway agent response can push the
+# combined prompt past the context window
+_MAX_AGENT_RESPONSE_TOKENS = 800
+
 
 class MultiAgentOrchestrator:
     """Orchestrates multiple agents and synthesizes responses."""
-    
-    def __init__(self, llm: ChatOpenAI, agents: Dict[str, Any]):
+
+    # Display names are static, so the map is built once at class-body time
+    # and frozen; instances share it instead of rebuilding a dict per call
+    _NAME_MAP: ClassVar[Dict[str, str]] = MappingProxyType({
+        "finance_qa": "Finance Q&A Agent 💬",
+        "portfolio_analyzer": "Portfolio Analyzer Agent 📊",
+        "market_analyst": "Market Analyst Agent 📈",
+        "goal_planner": "Goal Planner Agent 🎯",
+        "tax_educator": "Tax Educator Agent 💰"
+    })
+
+    def __init__(
+        self,
+        llm: ChatOpenAI,
+        agents: Dict[str, Any],
+        llm_semaphore: asyncio.Semaphore = None
+    ):
         """
         Initialize the orchestrator.
-        
+
         Args:
             llm: Language model for synthesis
             agents: Dictionary of agent instances
+            llm_semaphore: Optional cap on concurrent agent LLM calls, so
+                fan-out doesn't stampede the provider into 429 backoff
         """
         self.llm = llm
         self.agents = agents
-        self.executor = ThreadPoolExecutor(max_workers=5)  # For parallel execution
-        logger.info(f"MultiAgentOrchestrator initialized with {len(agents)} agents")
+        self.llm_semaphore = llm_semaphore
+        logger.info("MultiAgentOrchestrator initialized with %s agents", len(agents))
         logger.info("✨ Parallel execution enabled for multiple agents")
     
     def execute_single_agent(
@@ -48,10 +96,10 @@ class MultiAgentOrchestrator:
         Returns:
             Agent's response
         """
-        logger.info(f"Executing single agent: {agent_name}")
+        logger.info("Executing single agent: %s", agent_name)
         
         if agent_name not in self.agents:
-            logger.error(f"Agent {agent_name} not found")
+            logger.error("Agent %s not found", agent_name)
             return f"Error: Agent '{agent_name}' not available."
         
         try:
@@ -59,9 +107,228 @@ class MultiAgentOrchestrator:
             response = agent.invoke(query, thread_id=thread_id)
             return response
         except Exception as e:
-            logger.error(f"Error executing {agent_name}: {e}")
+            logger.error("Error executing %s: %s", agent_name, e)
             return f"Error from {agent_name}: {str(e)}"
-    
+
+    def _invoke_one(self, agent_name: str, query: str, thread_id: str) -> str:
+        """Invoke one agent with the shared error handling."""
+        if agent_name not in self.agents:
+            logger.warning("Agent %s not found", agent_name)
+            return f"Error: Agent '{agent_name}' not available."
+
+        try:
+            response = self.agents[agent_name].invoke(query, thread_id=thread_id)
+            logger.info("✅ %s completed", agent_name)
+            return response
+        except Exception as e:
+            logger.error("❌ Error from %s: %s", agent_name, e)
+            return f"Error: {str(e)}"
+
+    async def _ainvoke_agent(self, agent_name: str, query: str, thread_id: str) -> str:
+        """Invoke one agent, honoring the provider concurrency cap if set.
+
+        Agents without a native ainvoke run their sync invoke on a worker
+        thread so they still overlap with the rest of the fan-out.
+        """
+        agent = self.agents[agent_name]
+        if self.llm_semaphore is None:
+            if hasattr(agent, 'ainvoke'):
+                return await agent.ainvoke(query, thread_id=thread_id)
+            return await asyncio.to_thread(agent.invoke, query, thread_id=thread_id)
+        async with self.llm_semaphore:
+            if hasattr(agent, 'ainvoke'):
+                return await agent.ainvoke(query, thread_id=thread_id)
+            return await asyncio.to_thread(agent.invoke, query, thread_id=thread_id)
+
+    async def _invoke_one_async(self, agent_name: str, query: str, thread_id: str) -> str:
+        """Async counterpart of _invoke_one with the shared error handling."""
+        if agent_name not in self.agents:
+            logger.warning("Agent %s not found", agent_name)
+            return f"Error: Agent '{agent_name}' not available."
+
+        try:
+            response = await self._ainvoke_agent(agent_name, query, thread_id)
+            logger.info("✅ %s completed", agent_name)
+            return response
+        except Exception as e:
+            logger.error("❌ Error from %s: %s", agent_name, e)
+            return f"Error: {str(e)}"
+
+    async def _execute_agents_parallel_async(
+        self,
+        agent_names: List[str],
+        query: str,
+        thread_id: str
+    ) -> Dict[str, str]:
+        """Fan agents out with asyncio.gather; errors surface as strings."""
+        results = await asyncio.gather(*(
+            self._invoke_one_async(agent_name, query, thread_id)
+            for agent_name in agent_names
+        ))
+        return dict(zip(agent_names, results))
+
+    async def execute_single_agent_async(
+        self,
+        agent_name: str,
+        query: str,
+        thread_id: str = "default"
+    ) -> str:
+        """
+        Execute a single agent query asynchronously.
+
+        Args:
+            agent_name: Name of the agent to execute
+            query: User's query
+            thread_id: Thread ID for conversation history
+
+        Returns:
+            Agent's response
+        """
+        logger.info("Executing single agent (async): %s", agent_name)
+
+        if agent_name not in self.agents:
+            logger.error("Agent %s not found", agent_name)
+            return f"Error: Agent '{agent_name}' not available."
+
+        try:
+            response = await self._ainvoke_agent(agent_name, query, thread_id)
+            return response
+        except Exception as e:
+            logger.error("Error executing %s: %s", agent_name, e)
+            return f"Error from {agent_name}: {str(e)}"
+
+    async def stream_single_agent(
+        self,
+        agent_name: str,
+        query: str,
+        thread_id: str = "default"
+    ):
+        """
+        Stream a single agent's response as text deltas.
+
+        Args:
+            agent_name: Name of the agent to execute
+            query: User's query
+            thread_id: Thread ID for conversation history
+
+        Yields:
+            Incremental chunks of the agent's response text
+        """
+        logger.info("Streaming single agent: %s", agent_name)
+
+        if agent_name not in self.agents:
+            logger.error("Agent %s not found", agent_name)
+            yield f"Error: Agent '{agent_name}' not available."
+            return
+
+        agent = self.agents[agent_name]
+        async for delta in agent.astream(query, thread_id=thread_id):
+            yield delta
+
+    async def execute_multiple_agents_async(
+        self,
+        agent_names: List[str],
+        query: str,
+        thread_id: str = "default"
+    ) -> str:
+        """
+        Execute multiple agents concurrently with asyncio.gather and
+        synthesize their responses.
+
+        Because agent calls are I/O-bound LLM round-trips, overlapping them
+        reduces multi-agent latency to roughly the slowest single agent.
+
+        Args:
+            agent_names: List of agent names to execute
+            query: User's query
+            thread_id: Thread ID for conversation history
+
+        Returns:
+            Synthesized response from all agents
+        """
+        logger.info("Executing multiple agents (async): %s", ', '.join(agent_names))
+
+        agent_responses = await self._execute_agents_parallel_async(
+            agent_names, query, thread_id)
+
+        if len(agent_responses) == 1:
+            return list(agent_responses.values())[0]
+        return self._synthesize_responses(query, agent_responses)
+
+    async def run_plan(
+        self,
+        plan: List[Any],
+        query: str,
+        thread_id: str = "default"
+    ) -> str:
+        """
+        Execute a dependency-aware agent plan with maximum concurrency.
+
+        Each plan step is an AgentCall (agent name + depends_on indices of
+        earlier steps). Steps are assigned ranks from their dependencies and
+        executed rank by rank: all steps of one rank run concurrently via
+        asyncio.gather, and dependent steps receive the output of their
+        upstream steps as extra context. Independent agents therefore still
+        fan out in parallel, while producer/consumer chains stay ordered.
+
+        Args:
+            plan: Ordered list of AgentCall steps (see multi_agent_router)
+            query: User's query
+            thread_id: Thread ID for conversation history
+
+        Returns:
+            Synthesized response from all agents
+        """
+        logger.info("Running plan: %s", ', '.join(call.agent for call in plan))
+
+        # Rank = longest dependency chain ending at this step; depends_on is
+        # validated by the router to reference earlier steps only (acyclic)
+        ranks = []
+        for i, call in enumerate(plan):
+            deps = [d for d in call.depends_on if 0 <= d < i]
+            ranks.append(1 + max((ranks[d] for d in deps), default=-1))
+
+        responses = [None] * len(plan)
+        for rank in range(max(ranks) + 1):
+            pending = []
+            for i in (i for i, r in enumerate(ranks) if r == rank):
+                call = plan[i]
+                if call.agent not in self.agents:
+                    logger.warning("Agent %s not found", call.agent)
+                    responses[i] = f"Error: Agent '{call.agent}' not available."
+                    continue
+
+                agent_query = query
+                deps = [d for d in call.depends_on if 0 <= d < i]
+                if deps:
+                    context = "\n\n".join(
+                        f"Output from {self._format_agent_name(plan[d].agent)}:\n{responses[d]}"
+                        for d in deps
+                    )
+                    agent_query = f"{query}\n\n{context}"
+
+                pending.append(
+                    (i, self._ainvoke_agent(call.agent, agent_query, thread_id))
+                )
+
+            results = await asyncio.gather(
+                *(task for _, task in pending), return_exceptions=True
+            )
+            for (i, _), result in zip(pending, results):
+                if isinstance(result, Exception):
+                    logger.error("❌ Error from %s: %s", plan[i].agent, result)
+                    responses[i] = f"Error: {str(result)}"
+                else:
+                    logger.info("✅ %s completed (rank %s)", plan[i].agent, rank)
+                    responses[i] = result
+
+        agent_responses = {
+            call.agent: response for call, response in zip(plan, responses)
+        }
+        if len(agent_responses) == 1:
+            return list(agent_responses.values())[0]
+        return self._synthesize_responses(query, agent_responses)
+
     def execute_multiple_agents(
         self,
         agent_names: List[str],
@@ -82,7 +349,7 @@ class MultiAgentOrchestrator:
         Returns:
             Synthesized response from all agents
         """
-        logger.info(f"Executing multiple agents: {', '.join(agent_names)}")
+        logger.info("Executing multiple agents: %s", ', '.join(agent_names))
         
         if parallel and len(agent_names) > 1:
             logger.info("⚡ Using parallel execution for reduced latency")
@@ -106,20 +373,10 @@ class MultiAgentOrchestrator:
         thread_id: str
     ) -> Dict[str, str]:
         """Execute agents sequentially (original method)."""
-        agent_responses = {}
-        for agent_name in agent_names:
-            if agent_name in self.agents:
-                try:
-                    agent = self.agents[agent_name]
-                    response = agent.invoke(query, thread_id=thread_id)
-                    agent_responses[agent_name] = response
-                    logger.info(f"✅ {agent_name} completed")
-                except Exception as e:
-                    logger.error(f"❌ Error from {agent_name}: {e}")
-                    agent_responses[agent_name] = f"Error: {str(e)}"
-            else:
-                logger.warning(f"Agent {agent_name} not found")
-        return agent_responses
+        return {
+            agent_name: self._invoke_one(agent_name, query, thread_id)
+            for agent_name in agent_names
+        }
     
     def _execute_agents_parallel(
         self,
@@ -128,112 +385,120 @@ class MultiAgentOrchestrator:
         thread_id: str
     ) -> Dict[str, str]:
         """
-        Execute agents in parallel using ThreadPoolExecutor.
-        Significantly reduces latency when multiple agents are needed.
+        Execute agents in parallel via asyncio.gather.
+
+        The fan-out is pure I/O waiting on the LLM provider, so event-loop
+        concurrency covers any number of agents without a thread per call
+        or a pool cap that silently serializes larger plans.
         """
-        def execute_agent(agent_name: str) -> tuple:
-            """Helper function to execute a single agent."""
-            if agent_name not in self.agents:
-                logger.warning(f"Agent {agent_name} not found")
-                return agent_name, f"Error: Agent not found"
-            
-            try:
-                agent = self.agents[agent_name]
-                response = agent.invoke(query, thread_id=thread_id)
-                logger.info(f"✅ {agent_name} completed")
-                return agent_name, response
-            except Exception as e:
-                logger.error(f"❌ Error from {agent_name}: {e}")
-                return agent_name, f"Error: {str(e)}"
-        
-        # Execute all agents in parallel
-        import time
         start_time = time.time()
-        
-        futures = [
-            self.executor.submit(execute_agent, agent_name)
-            for agent_name in agent_names
-        ]
-        
-        # Collect results
-        agent_responses = {}
-        for future in futures:
-            agent_name, response = future.result()
-            agent_responses[agent_name] = response
-        
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            agent_responses = asyncio.run(
+                self._execute_agents_parallel_async(agent_names, query, thread_id))
+        else:
+            # Called synchronously from inside a running loop: blocking on
+            # a nested loop isn't possible, so degrade to sequential (async
+            # callers should use execute_multiple_agents_async instead)
+            logger.debug("Event loop already running; executing sequentially")
+            agent_responses = self._execute_agents_sequential(
+                agent_names, query, thread_id)
+
         elapsed = time.time() - start_time
-        logger.info(f"⚡ Parallel execution completed in {elapsed:.2f}s (saved ~{len(agent_names)*2-elapsed:.1f}s)")
-        
+        logger.info("⚡ Parallel execution completed in %.2fs (saved ~%.1fs)", elapsed, len(agent_names)*2-elapsed)
+
         return agent_responses
     
-    def _synthesize_responses(
+    def _truncate_response(self, response: str) -> str:
+        """Cap one agent response's token contribution to the synthesis prompt.
+
+        Oversized responses keep their head and tail — the lead-in and any
+        closing disclaimers — with the middle elided.
+        """
+        try:
+            token_count = self.llm.get_num_tokens(response)
+        except Exception:
+            token_count = len(response) // 4  # rough chars-per-token estimate
+        if token_count <= _MAX_AGENT_RESPONSE_TOKENS:
+            return response
+
+        logger.info("Truncating agent response for synthesis (%s tokens)", token_count)
+        return f"{response[:2000]}\n...[truncated]...\n{response[-1000:]}"
+
+    def _synthesis_messages(self, query: str, agent_responses: Dict[str, str]):
+        """Build the synthesis prompt messages and the formatted fallback."""
+        formatted_responses = "\n\n".join(
+            f"=== {self._format_agent_name(name)} ===\n{self._truncate_response(response)}"
+            for name, response in agent_responses.items()
+        )
+
+        messages = [
+            _SYNTH_SYSTEM_MESSAGE,
+            HumanMessage(content=_SYNTH_PROMPT.format(
+                query=query, responses=formatted_responses))
+        ]
+        return messages, formatted_responses
+
+    def synthesize_responses_stream(
         self,
         query: str,
         agent_responses: Dict[str, str]
-    ) -> str:
+    ):
         """
-        Synthesize responses from multiple agents into a coherent answer.
-        
+        Stream the synthesized answer as incremental text chunks.
+
+        Tokens reach the caller as soon as the model emits them, so
+        time-to-first-output is one chunk latency instead of the full
+        synthesis round trip. On error, yields the concatenated agent
+        responses as the fallback.
+
         Args:
             query: Original user query
             agent_responses: Dictionary mapping agent names to their responses
-            
-        Returns:
-            Synthesized response
+
+        Yields:
+            Incremental chunks of the synthesized response text
         """
-        logger.info(f"Synthesizing responses from {len(agent_responses)} agents")
-        
-        # Format agent responses
-        formatted_responses = "\n\n".join([
-            f"=== {self._format_agent_name(name)} ===\n{response}"
-            for name, response in agent_responses.items()
-        ])
-        
-        synthesis_prompt = f"""You are synthesizing responses from multiple specialized financial AI agents.
+        logger.info("Synthesizing responses from %s agents (streaming)", len(agent_responses))
 
-Original User Query: "{query}"
+        messages, formatted_responses = self._synthesis_messages(query, agent_responses)
+        try:
+            for chunk in self.llm.stream(messages):
+                if chunk.content:
+                    yield chunk.content
+            logger.info("✅ Successfully synthesized responses")
+        except Exception as e:
+            logger.error("❌ Error synthesizing responses: %s", e)
+            # Fallback: yield concatenated responses
+            yield formatted_responses
 
-Agent Responses:
-{formatted_responses}
+    def _synthesize_responses(
+        self,
+        query: str,
+        agent_responses: Dict[str, str]
+    ) -> str:
+        """
+        Synthesize responses from multiple agents into a coherent answer.
 
-Instructions:
-1. Combine all agent responses into ONE comprehensive, well-organized answer
-2. Eliminate redundancy while preserving all unique information
-3. Organize information logically (e.g., data first, then analysis, then recommendations)
-4. Maintain the educational tone
-5. Keep all disclaimers about not being financial advice
-6. Use clear headings and bullet points for readability
-7. Make it feel like a single, cohesive response (not separate agent outputs)
+        Blocking wrapper over the streaming path for callers that need the
+        full text at once.
 
-Synthesized Response:"""
+        Args:
+            query: Original user query
+            agent_responses: Dictionary mapping agent names to their responses
 
-        try:
-            messages = [
-                SystemMessage(content="You are an expert at synthesizing information from multiple sources into clear, comprehensive responses."),
-                HumanMessage(content=synthesis_prompt)
-            ]
-            
-            response = self.llm.invoke(messages)
-            synthesized = response.content.strip()
-            
-            logger.info("✅ Successfully synthesized responses")
-            return synthesized
-            
-        except Exception as e:
-            logger.error(f"❌ Error synthesizing responses: {e}")
-            # Fallback: return concatenated responses
-            return formatted_responses
+        Returns:
+            Synthesized response
+        """
+        return "".join(
+            self.synthesize_responses_stream(query, agent_responses)
+        ).strip()
     
     def _format_agent_name(self, agent_name: str) -> str:
         """Format agent name for display."""
-        name_map = {
-            "finance_qa": "Finance Q&A Agent 💬",
-            "portfolio_analyzer": "Portfolio Analyzer Agent 📊",
-            "market_analyst": "Market Analyst Agent 📈",
-            "goal_planner": "Goal Planner Agent 🎯",
-            "tax_educator": "Tax Educator Agent 💰"
-        }
-        return name_map.get(agent_name, agent_name)
+        return self._NAME_MAP.get(agent_name, agent_name)
     
     def get_agent_info(self) -> Dict[str, Any]:
         """Get information about all available agents."""
@@ -245,16 +510,18 @@ Synthesized Response:"""
 
 def create_orchestrator(
     llm: ChatOpenAI,
-    agents: Dict[str, Any]
+    agents: Dict[str, Any],
+    llm_semaphore: asyncio.Semaphore = None
 ) -> MultiAgentOrchestrator:
     """
     Factory function to create an orchestrator.
-    
+
     Args:
         llm: Language model for synthesis
         agents: Dictionary of agent instances
-        
+        llm_semaphore: Optional cap on concurrent agent LLM calls
+
     Returns:
         MultiAgentOrchestrator instance
     """
-    return MultiAgentOrchestrator(llm, agents)
+    return MultiAgentOrchestrator(llm, agents, llm_semaphore)
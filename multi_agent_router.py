@@ -4,14 +4,55 @@ Routes user queries to the most appropriate specialized agent(s).
 Uses LLM-based task planning with reasoning for intelligent routing.
 """
 
+import re
 import logging
-from typing import Dict, List, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
+from pydantic import BaseModel, Field
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from batched_llm import BatchedLLM
+
 logger = logging.getLogger(__name__)
 
 
+class RoutingDecision(BaseModel):
+    """Structured routing output: selected agents plus the reasoning."""
+
+    agents: List[str] = Field(
+        description="Names of the agents that should handle the query "
+                    "(finance_qa, portfolio_analyzer, market_analyst, goal_planner, tax_educator)"
+    )
+    reasoning: str = Field(
+        description="Brief explanation of why these agents were selected"
+    )
+
+
+class AgentCall(BaseModel):
+    """One step of a routing plan: an agent plus the calls it depends on."""
+
+    agent: str = Field(
+        description="Name of the agent to call "
+                    "(finance_qa, portfolio_analyzer, market_analyst, goal_planner, tax_educator)"
+    )
+    depends_on: List[int] = Field(
+        default_factory=list,
+        description="Indices of earlier calls in the plan whose output this "
+                    "call needs as input; empty if the call is independent"
+    )
+
+
+class RoutingPlan(BaseModel):
+    """Structured routing output as an ordered plan with dependencies."""
+
+    calls: List[AgentCall] = Field(
+        description="Ordered list of agent calls; independent calls can run concurrently"
+    )
+    reasoning: str = Field(
+        description="Brief explanation of why these agents were selected"
+    )
+
+
 class QueryRouter:
     """Routes queries to appropriate specialized agents."""
     
@@ -64,11 +105,79 @@ class QueryRouter:
         """
     }
     
+    # Fast-path intent patterns, compiled once. Each pattern is a strong
+    # signal for exactly one agent; a query matching zero or several
+    # patterns is ambiguous and falls through to the LLM router.
+    FAST_ROUTES = (
+        (re.compile(r"\b(?:what\s+is|what\s+are|explain|define)\b", re.IGNORECASE),
+         "finance_qa"),
+        (re.compile(r"\b(?:price|quote|trading\s+at|market\s+ind(?:ex|ices)|s&p\s*500|nasdaq|dow\s+jones)\b", re.IGNORECASE),
+         "market_analyst"),
+        (re.compile(r"\b(?:my\s+portfolio|these\s+holdings|analy[sz]e\s+(?:my|this)\s+portfolio)\b", re.IGNORECASE),
+         "portfolio_analyzer"),
+        (re.compile(r"\b(?:retire(?:ment)?|save\s+for|savings\s+goal)\b", re.IGNORECASE),
+         "goal_planner"),
+        (re.compile(r"\b(?:ira|roth|401\(?k\)?|hsa|tax(?:es|able)?|capital\s+gains|tax[- ]loss)\b", re.IGNORECASE),
+         "tax_educator"),
+    )
+
     def __init__(self, llm: ChatOpenAI):
         """Initialize the query router."""
         self.llm = llm
+        # Built lazily on first aplan_and_explain call (mirroring
+        # BatchedLLM's own lazy queue): with_structured_output is only
+        # available on a real chat model, and callers that never plan —
+        # including tests constructing the router with a bare model name —
+        # shouldn't pay for or depend on it
+        self._batched_router = None
+        # The routing prompts are fully static, so render them (and their
+        # SystemMessage wrappers) once instead of re-templating per request
+        self._routing_message = SystemMessage(content=self._build_routing_prompt())
+        self._planning_message = SystemMessage(content=self._build_planning_prompt())
+        self._legacy_routing_message = SystemMessage(content=self._build_legacy_routing_prompt())
         logger.info("QueryRouter initialized")
     
+    def fast_route(self, query: str) -> Optional[List[str]]:
+        """
+        Route obvious single-intent queries with regexes alone - no LLM call.
+
+        Returns the agent list only when exactly one intent pattern matches;
+        anything ambiguous (zero or multiple matches) returns None so the
+        caller falls back to the LLM router.
+
+        Args:
+            query: User's query string
+
+        Returns:
+            List with one agent name, or None if the query is ambiguous
+        """
+        matched = {
+            agent for pattern, agent in self.FAST_ROUTES
+            if pattern.search(query)
+        }
+
+        if len(matched) == 1:
+            agent = matched.pop()
+            logger.info(f"⚡ Fast-path routed to {agent} (no LLM call)")
+            return [agent]
+        return None
+
+    def fast_route_plan(self, query: str) -> Optional[Tuple[List[AgentCall], str]]:
+        """
+        Fast-path counterpart of aplan_and_explain.
+
+        Args:
+            query: User's query string
+
+        Returns:
+            Tuple of (plan, explanation) on a fast-path hit, else None
+        """
+        agents = self.fast_route(query)
+        if agents is None:
+            return None
+        plan = [AgentCall(agent=name) for name in agents]
+        return plan, self.explain_routing(query, agents)
+
     def route_query(self, query: str, explain: bool = False) -> Tuple[List[str], str]:
         """
         Route a query to the most appropriate agent(s) using LLM-based task planning.
@@ -81,66 +190,13 @@ class QueryRouter:
             Tuple of (List of agent names, reasoning explanation)
         """
         logger.info(f"Routing query: {query[:100]}...")
-        
-        # Create routing prompt with reasoning
-        agents_info = "\n\n".join([
-            f"**{name}**: {desc.strip()}"
-            for name, desc in self.AGENT_DESCRIPTIONS.items()
-        ])
-        
-        system_prompt = f"""You are an intelligent query routing system for a financial AI assistant.
-You use LLM-based task planning to determine the optimal agent(s) for each query.
-
-Available Agents:
-{agents_info}
-
-Instructions:
-1. Analyze the user's query to understand their intent and information needs
-2. Use task decomposition - break complex queries into component tasks
-3. Select the MOST appropriate agent(s) to handle each task
-4. Usually select ONE agent, but select 2-3 if the query requires multiple specialties
-5. Provide your reasoning for the selection
-
-Response Format:
-AGENTS: [comma-separated agent names]
-REASONING: [brief explanation of why these agents were selected]
-
-Valid agent names: finance_qa, portfolio_analyzer, market_analyst, goal_planner, tax_educator
-
-Examples:
-
-Query: "What is a diversified portfolio?"
-AGENTS: finance_qa
-REASONING: This is a definitional question about a financial concept, best handled by the educational agent.
-
-Query: "What's the current price of Apple stock?"
-AGENTS: market_analyst
-REASONING: Requires real-time market data retrieval.
-
-Query: "I have AAPL, MSFT, GOOGL in my portfolio. Should I invest more?"
-AGENTS: portfolio_analyzer,market_analyst
-REASONING: Needs portfolio analysis to assess current holdings AND market data for informed recommendations.
-
-Query: "I'm 30 and want to retire at 65. How much should I save?"
-AGENTS: goal_planner
-REASONING: Retirement planning calculation requiring goal-based financial planning.
-
-Query: "Should I use a Traditional IRA or Roth IRA?"
-AGENTS: tax_educator
-REASONING: Tax-advantaged account comparison requiring tax education expertise.
-
-Query: "What's Tesla's stock price and is it a good investment for me?"
-AGENTS: market_analyst,finance_qa
-REASONING: Needs current market data (price) AND educational context about investment evaluation principles.
-
-Now route the following query:"""
 
         try:
             messages = [
-                SystemMessage(content=system_prompt),
+                self._legacy_routing_message,
                 HumanMessage(content=query)
             ]
-            
+
             response = self.llm.invoke(messages)
             routing_result = response.content.strip()
             
@@ -186,6 +242,217 @@ Now route the following query:"""
             reasoning = "Error in routing - defaulting to general education"
             return ["finance_qa"] if not explain else (["finance_qa"], reasoning)
     
+    def route_and_explain(self, query: str) -> Tuple[List[str], str]:
+        """
+        Route a query and produce its routing explanation in a single LLM call.
+
+        Uses structured output so agent selection and reasoning come back in
+        one round-trip instead of requiring a second parse/explain step.
+
+        Args:
+            query: User's query string
+
+        Returns:
+            Tuple of (List of agent names, human-readable routing explanation)
+        """
+        logger.info(f"Routing query (structured): {query[:100]}...")
+
+        try:
+            structured_llm = self.llm.with_structured_output(RoutingDecision)
+            decision = structured_llm.invoke([
+                self._routing_message,
+                HumanMessage(content=query)
+            ])
+
+            valid_agents = self._validate_decision(decision)
+            return valid_agents, self.explain_routing(query, valid_agents)
+
+        except Exception as e:
+            logger.error(f"❌ Error routing query: {e}")
+            # Default to finance_qa on error
+            return ["finance_qa"], self.explain_routing(query, ["finance_qa"])
+
+    async def aplan_and_explain(self, query: str) -> Tuple[List[AgentCall], str]:
+        """
+        Produce an ordered agent plan with dependencies in one LLM call.
+
+        Goes through the micro-batcher, so routing calls from concurrent
+        sessions are coalesced into a single OpenAI batch request. Each
+        plan step names an agent and the earlier steps whose output it
+        needs; independent steps can be scheduled concurrently (see
+        MultiAgentOrchestrator.run_plan).
+
+        Args:
+            query: User's query string
+
+        Returns:
+            Tuple of (List of AgentCall steps, human-readable routing explanation)
+        """
+        logger.info(f"Planning query (async): {query[:100]}...")
+
+        try:
+            if self._batched_router is None:
+                # Routing prompts are small and uniform, so concurrent
+                # routing calls coalesce well into one batched OpenAI call
+                self._batched_router = BatchedLLM(
+                    self.llm.with_structured_output(RoutingPlan)
+                )
+            plan = await self._batched_router.ainvoke([
+                self._planning_message,
+                HumanMessage(content=query)
+            ])
+
+            valid_calls = self._validate_plan(plan)
+            agents = [call.agent for call in valid_calls]
+            return valid_calls, self.explain_routing(query, agents)
+
+        except Exception as e:
+            logger.error(f"❌ Error planning query: {e}")
+            # Default to finance_qa on error
+            return [AgentCall(agent="finance_qa")], self.explain_routing(query, ["finance_qa"])
+
+    async def aroute_and_explain(self, query: str) -> Tuple[List[str], str]:
+        """
+        Async version of route_and_explain (agent names only, no plan).
+
+        Args:
+            query: User's query string
+
+        Returns:
+            Tuple of (List of agent names, human-readable routing explanation)
+        """
+        calls, explanation = await self.aplan_and_explain(query)
+        return [call.agent for call in calls], explanation
+
+    def _build_legacy_routing_prompt(self) -> str:
+        """Build the few-shot AGENTS:/REASONING: prompt for route_query (rendered once)."""
+        agents_info = "\n\n".join([
+            f"**{name}**: {desc.strip()}"
+            for name, desc in self.AGENT_DESCRIPTIONS.items()
+        ])
+
+        return f"""You are an intelligent query routing system for a financial AI assistant.
+You use LLM-based task planning to determine the optimal agent(s) for each query.
+
+Available Agents:
+{agents_info}
+
+Instructions:
+1. Analyze the user's query to understand their intent and information needs
+2. Use task decomposition - break complex queries into component tasks
+3. Select the MOST appropriate agent(s) to handle each task
+4. Usually select ONE agent, but select 2-3 if the query requires multiple specialties
+5. Provide your reasoning for the selection
+
+Response Format:
+AGENTS: [comma-separated agent names]
+REASONING: [brief explanation of why these agents were selected]
+
+Valid agent names: finance_qa, portfolio_analyzer, market_analyst, goal_planner, tax_educator
+
+Examples:
+
+Query: "What is a diversified portfolio?"
+AGENTS: finance_qa
+REASONING: This is a definitional question about a financial concept, best handled by the educational agent.
+
+Query: "What's the current price of Apple stock?"
+AGENTS: market_analyst
+REASONING: Requires real-time market data retrieval.
+
+Query: "I have AAPL, MSFT, GOOGL in my portfolio. Should I invest more?"
+AGENTS: portfolio_analyzer,market_analyst
+REASONING: Needs portfolio analysis to assess current holdings AND market data for informed recommendations.
+
+Query: "I'm 30 and want to retire at 65. How much should I save?"
+AGENTS: goal_planner
+REASONING: Retirement planning calculation requiring goal-based financial planning.
+
+Query: "Should I use a Traditional IRA or Roth IRA?"
+AGENTS: tax_educator
+REASONING: Tax-advantaged account comparison requiring tax education expertise.
+
+Query: "What's Tesla's stock price and is it a good investment for me?"
+AGENTS: market_analyst,finance_qa
+REASONING: Needs current market data (price) AND educational context about investment evaluation principles.
+
+Now route the following query:"""
+
+    def _build_routing_prompt(self) -> str:
+        """Build the system prompt for structured routing (rendered once)."""
+        agents_info = "\n\n".join([
+            f"**{name}**: {desc.strip()}"
+            for name, desc in self.AGENT_DESCRIPTIONS.items()
+        ])
+
+        return f"""You are an intelligent query routing system for a financial AI assistant.
+
+Available Agents:
+{agents_info}
+
+Instructions:
+1. Analyze the user's query to understand their intent and information needs
+2. Use task decomposition - break complex queries into component tasks
+3. Select the MOST appropriate agent(s) to handle each task
+4. Usually select ONE agent, but select 2-3 if the query requires multiple specialties
+5. Provide brief reasoning for the selection
+
+Valid agent names: finance_qa, portfolio_analyzer, market_analyst, goal_planner, tax_educator"""
+
+    def _build_planning_prompt(self) -> str:
+        """Build the system prompt for dependency-aware plan routing (rendered once)."""
+        return self._build_routing_prompt() + """
+
+Plan Format:
+Return an ordered list of agent calls. For each call, set depends_on to the
+indices (0-based) of EARLIER calls whose output it needs as input; leave it
+empty when the call can run independently. Most plans have one call with no
+dependencies. Example: "get Tesla's price, then assess it for my portfolio"
+-> calls: [market_analyst (depends_on: []), portfolio_analyzer (depends_on: [0])]"""
+
+    def _validate_plan(self, plan: RoutingPlan) -> List[AgentCall]:
+        """
+        Validate a routing plan: drop unknown agents, clamp dependencies to
+        earlier steps (guaranteeing the plan is acyclic), default to finance_qa.
+        """
+        valid_calls = []
+        for call in plan.calls:
+            name = call.agent.strip().lower()
+            if name not in self.AGENT_DESCRIPTIONS:
+                logger.warning(f"Dropping unknown agent in plan: {call.agent}")
+                continue
+            deps = sorted({
+                d for d in call.depends_on if 0 <= d < len(valid_calls)
+            })
+            valid_calls.append(AgentCall(agent=name, depends_on=deps))
+
+        if not valid_calls:
+            logger.warning(f"No valid agents in routing plan: {plan.calls}")
+            valid_calls = [AgentCall(agent="finance_qa")]
+
+        logger.info(f"✅ Planned agents: {', '.join(c.agent for c in valid_calls)}")
+        if plan.reasoning:
+            logger.info(f"💡 Reasoning: {plan.reasoning}")
+
+        return valid_calls
+
+    def _validate_decision(self, decision: RoutingDecision) -> List[str]:
+        """Validate a routing decision's agent names, defaulting to finance_qa."""
+        valid_agents = [
+            name.strip().lower() for name in decision.agents
+            if name.strip().lower() in self.AGENT_DESCRIPTIONS
+        ]
+
+        if not valid_agents:
+            logger.warning(f"No valid agents in routing decision: {decision.agents}")
+            valid_agents = ["finance_qa"]
+
+        logger.info(f"✅ Routed to agents: {', '.join(valid_agents)}")
+        if decision.reasoning:
+            logger.info(f"💡 Reasoning: {decision.reasoning}")
+
+        return valid_agents
+
     def explain_routing(self, query: str, agents: List[str]) -> str:
         """
         Provide a brief explanation of why the query was routed to specific agents.
@@ -178,13 +178,16 @@ def run_evaluation(
     
     try:
         if client:
-            # Run with LangSmith
+            # Run with LangSmith; the evaluators are regex work and LLM
+            # calls, so a thread pool collapses wall-clock time to roughly
+            # the slowest judge round trip
             results = evaluate(
                 evaluator_func,
                 data=dataset_name,
                 evaluators=evaluators,
                 experiment_prefix=experiment_name,
-                num_repetitions=1  # Run each example once
+                num_repetitions=1,  # Run each example once
+                max_concurrency=min(16, len(FinanceEvaluationDataset.TEST_CASES))
             )
             
             logger.info("\n✅ Evaluation complete!")
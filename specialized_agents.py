@@ -9,7 +9,7 @@ from langchain_openai import ChatOpenAI
 from langchain.tools import tool
 from langgraph.prebuilt import create_react_agent
 from langgraph.checkpoint.memory import MemorySaver
-from langchain_core.messages import SystemMessage
+from langchain_core.messages import SystemMessage, AIMessageChunk
 
 # Setup logging
 logger = logging.getLogger(__name__)
@@ -62,6 +62,61 @@ class BaseFinanceAgent:
             logger.error(f"{self.name} invoke failed: {str(e)}", exc_info=True)
             return f"Error: {str(e)}"
     
+    async def ainvoke(self, query: str, thread_id: str = "default") -> str:
+        """Invoke the agent asynchronously with a query."""
+        logger.debug(f"{self.name} invoked (async) with query: {query[:100]}...")
+        config = {"configurable": {"thread_id": thread_id}}
+
+        try:
+            # Add system prompt as first message
+            messages = [
+                SystemMessage(content=self.system_prompt),
+                ("user", query)
+            ]
+
+            response = await self.agent.ainvoke(
+                {"messages": messages},
+                config=config
+            )
+
+            # Extract the final response
+            messages = response.get("messages", [])
+            if messages:
+                result = messages[-1].content
+                logger.debug(f"{self.name} generated response of length {len(result)}")
+                return result
+
+            logger.warning(f"{self.name} generated no response")
+            return "No response generated."
+
+        except Exception as e:
+            logger.error(f"{self.name} async invoke failed: {str(e)}", exc_info=True)
+            return f"Error: {str(e)}"
+
+    async def astream(self, query: str, thread_id: str = "default"):
+        """Stream the agent's response token-by-token as text deltas."""
+        logger.debug(f"{self.name} streaming query: {query[:100]}...")
+        config = {"configurable": {"thread_id": thread_id}}
+
+        messages = [
+            SystemMessage(content=self.system_prompt),
+            ("user", query)
+        ]
+
+        try:
+            async for chunk, _metadata in self.agent.astream(
+                {"messages": messages},
+                config=config,
+                stream_mode="messages"
+            ):
+                # Only surface model text, not tool call payloads
+                if isinstance(chunk, AIMessageChunk) and chunk.content:
+                    yield chunk.content
+
+        except Exception as e:
+            logger.error(f"{self.name} stream failed: {str(e)}", exc_info=True)
+            yield f"Error: {str(e)}"
+
     def get_info(self) -> Dict[str, Any]:
         """Get agent information."""
         return {
@@ -0,0 +1,92 @@
+"""
+Unit Tests for the LLM Micro-Batcher
+Tests that concurrent ainvoke calls coalesce into single abatch calls.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from batched_llm import BatchedLLM
+
+
+class _RecordingRunnable:
+    """Fake runnable: records each batch size and echoes inputs back."""
+
+    def __init__(self):
+        self.batch_sizes = []
+
+    async def abatch(self, inputs):
+        self.batch_sizes.append(len(inputs))
+        return [f"out:{item}" for item in inputs]
+
+
+class _FailingRunnable:
+    """Fake runnable whose batches always fail."""
+
+    async def abatch(self, inputs):
+        raise RuntimeError("batch exploded")
+
+
+class TestBatchedLLM:
+    """Test request coalescing and result fan-out"""
+
+    def test_concurrent_calls_coalesce_into_one_batch(self):
+        """Calls arriving within one window share a single abatch call"""
+        runnable = _RecordingRunnable()
+        batcher = BatchedLLM(runnable, max_batch_size=8, window_ms=50)
+
+        async def run():
+            return await asyncio.gather(
+                *(batcher.ainvoke(f"q{i}") for i in range(5))
+            )
+
+        results = asyncio.run(run())
+        # Each caller gets its own result back, in submission order
+        assert results == [f"out:q{i}" for i in range(5)]
+        assert runnable.batch_sizes == [5]
+
+    def test_single_call_passes_through(self):
+        """A lone request is sent as a batch of one"""
+        runnable = _RecordingRunnable()
+        batcher = BatchedLLM(runnable, window_ms=1)
+
+        async def run():
+            return await batcher.ainvoke("solo")
+
+        assert asyncio.run(run()) == "out:solo"
+        assert runnable.batch_sizes == [1]
+
+    def test_max_batch_size_respected(self):
+        """No batch ever exceeds max_batch_size"""
+        runnable = _RecordingRunnable()
+        batcher = BatchedLLM(runnable, max_batch_size=2, window_ms=50)
+
+        async def run():
+            return await asyncio.gather(
+                *(batcher.ainvoke(f"q{i}") for i in range(5))
+            )
+
+        results = asyncio.run(run())
+        assert len(results) == 5
+        assert all(size <= 2 for size in runnable.batch_sizes)
+
+    def test_batch_failure_propagates_to_caller(self):
+        """A failed batch rejects every pending caller"""
+        batcher = BatchedLLM(_FailingRunnable(), window_ms=1)
+
+        async def run():
+            return await batcher.ainvoke("q")
+
+        with pytest.raises(RuntimeError, match="batch exploded"):
+            asyncio.run(run())
+
+
+# Run tests with: pytest tests/test_batched_llm.py -v
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "--tb=short"])
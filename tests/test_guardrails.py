@@ -5,7 +5,7 @@ Tests input validation, content safety, rate limiting, and output validation.
 
 import pytest
 from datetime import datetime, timedelta
-from guardrails import FinanceGuardrails, create_guardrails
+from guardrails import FinanceGuardrails, create_guardrails, _SessionStats, _TokenBucket
 
 
 class TestInputValidation:
@@ -152,6 +152,48 @@ class TestRateLimiting:
         assert is_valid
 
 
+class TestRateLimitPrimitives:
+    """Test the token bucket and sliding-window counters directly."""
+
+    def test_token_bucket_refills_over_time(self):
+        """Tokens accrue at refill_per_sec between checks."""
+        bucket = _TokenBucket(capacity=10, refill_per_sec=1.0, tokens=0.0, last=100.0)
+        bucket.refill(103.0)
+        assert bucket.tokens == 3.0
+
+    def test_token_bucket_caps_at_capacity(self):
+        """A long idle period can't bank more than capacity tokens."""
+        bucket = _TokenBucket(capacity=10, refill_per_sec=1.0, tokens=9.0, last=100.0)
+        bucket.refill(500.0)
+        assert bucket.tokens == 10.0
+
+    def test_session_stats_counts_current_window(self):
+        """Queries recorded now show up in both window counts."""
+        now = 1_000_000.0
+        stats = _SessionStats.new(now)
+        for _ in range(3):
+            stats.record(now)
+        assert stats.last_minute(now) == 3
+        assert stats.last_hour(now) == 3
+        assert stats.total == 3
+
+    def test_session_stats_minute_window_slides(self):
+        """Queries fall out of the minute window but stay in the hour."""
+        now = 1_000_000.0
+        stats = _SessionStats.new(now)
+        stats.record(now)
+        assert stats.last_minute(now + 61) == 0
+        assert stats.last_hour(now + 61) == 1
+
+    def test_session_stats_hour_window_slides(self):
+        """Queries fall out of the hour window; the lifetime total remains."""
+        now = 1_000_000.0
+        stats = _SessionStats.new(now)
+        stats.record(now)
+        assert stats.last_hour(now + 3601) == 0
+        assert stats.total == 1
+
+
 class TestOutputValidation:
     """Test output validation functionality."""
     
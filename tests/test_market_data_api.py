@@ -28,7 +28,7 @@ class TestMarketDataAPI:
         """Test that API initializes correctly"""
         assert market_api is not None
         assert hasattr(market_api, 'cache')
-        assert hasattr(market_api, 'last_request_time')
+        assert hasattr(market_api, '_bucket')
     
     def test_cache_functionality(self, market_api):
         """Test that caching works"""
@@ -56,9 +56,17 @@ class TestMarketDataAPI:
         # Note: In actual test, we'd need to wait or mock time
     
     def test_rate_limiting(self, market_api):
-        """Test that rate limiting is applied"""
-        assert hasattr(market_api, 'min_request_interval')
-        assert market_api.min_request_interval > 0
+        """Test that token-bucket rate limiting is applied"""
+        bucket = market_api._bucket
+        assert bucket.rate > 0
+        assert bucket.capacity >= 1
+
+        # A burst up to the bucket capacity should not sleep
+        import time
+        start = time.monotonic()
+        for _ in range(int(bucket.capacity)):
+            bucket.acquire()
+        assert time.monotonic() - start < 0.1
     
     def test_get_stock_quote_structure(self, market_api):
         """Test that get_stock_quote returns proper structure"""
@@ -113,6 +121,44 @@ class TestMarketDataAPI:
         assert isinstance(result["results"], list)
 
 
+def _batch_frame():
+    """Two-ticker frame shaped like yf.download(group_by='ticker') output"""
+    import pandas as pd
+    frames = {
+        "AAA": pd.DataFrame({"Open": [10.0, 12.0], "Close": [10.0, 12.0]}),
+        "BBB": pd.DataFrame({"Open": [20.0, 19.0], "Close": [20.0, 19.0]}),
+    }
+    return pd.concat(frames, axis=1)
+
+
+class TestBatchQuotes:
+    """Test the multi-ticker batch quote path (network mocked out)"""
+
+    def test_batch_quotes_computed_and_cached(self, market_api):
+        with patch("market_data_api.yf.download",
+                   return_value=_batch_frame()) as download:
+            results = market_api.get_stock_quotes_batch(["AAA", "BBB"])
+
+            assert set(results) == {"AAA", "BBB"}
+            assert results["AAA"]["price"] == 12.0
+            assert results["AAA"]["change"] == 2.0
+            assert results["AAA"]["change_percent"] == 20.0
+            assert results["BBB"]["price"] == 19.0
+            assert results["BBB"]["change"] == -1.0
+            assert results["BBB"]["change_percent"] == -5.0
+
+            # Second call should be served entirely from the cache
+            again = market_api.get_stock_quotes_batch(["AAA", "BBB"])
+            assert again["AAA"]["price"] == 12.0
+            assert download.call_count == 1
+
+    def test_batch_quotes_download_failure(self, market_api):
+        """A failed download returns whatever the cache had (here: nothing)"""
+        with patch("market_data_api.yf.download",
+                   side_effect=Exception("network down")):
+            assert market_api.get_stock_quotes_batch(["AAA"]) == {}
+
+
 class TestErrorHandling:
     """Test error handling in MarketDataAPI"""
     
@@ -126,6 +126,31 @@ class TestRouting:
         assert any(agent in route for agent in ["goal_planner", "portfolio_analyzer", "tax_educator"])
 
 
+class TestFastRoute:
+    """Test the regex fast-path router (no LLM call involved)"""
+
+    def test_price_query_fast_routes(self, router):
+        """Test that price queries hit the market_analyst fast path"""
+        assert router.fast_route("AAPL price today") == ["market_analyst"]
+
+    def test_definition_query_fast_routes(self, router):
+        """Test that definitional queries hit the finance_qa fast path"""
+        assert router.fast_route("Define a mutual fund") == ["finance_qa"]
+
+    def test_tax_query_fast_routes(self, router):
+        """Test that account-type queries hit the tax_educator fast path"""
+        assert router.fast_route("Roth IRA contribution limits") == ["tax_educator"]
+
+    def test_ambiguous_query_falls_through(self, router):
+        """Queries matching several intent patterns defer to the LLM router"""
+        # Matches both the definition and price patterns
+        assert router.fast_route("What is the price of AAPL?") is None
+
+    def test_unmatched_query_falls_through(self, router):
+        """Queries matching no intent pattern defer to the LLM router"""
+        assert router.fast_route("Tell me something interesting") is None
+
+
 class TestAgents:
     """Test the agent functionality"""
     
@@ -0,0 +1,78 @@
+"""
+Unit Tests for the NumPy Brute-Force Retriever
+Tests top-k ranking order over a small fixture matrix.
+"""
+
+import os
+import sys
+
+import numpy as np
+from langchain_core.documents import Document
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from numpy_retriever import NumpyRetriever
+
+
+class _FixedEmbeddings:
+    """Fake embeddings client returning a fixed query vector."""
+
+    def __init__(self, vector):
+        self.vector = vector
+
+    def embed_query(self, query):
+        return self.vector
+
+
+def _make_retriever(query_vector, k=3):
+    """Retriever over four unit rows at increasing angles to the x-axis,
+    so cosine similarity against an x-axis query strictly decreases with
+    the row index."""
+    matrix = np.array([
+        [1.0, 0.0],
+        [0.8, 0.6],
+        [0.6, 0.8],
+        [0.0, 1.0],
+    ], dtype=np.float32)
+    documents = [Document(page_content=f"doc{i}") for i in range(len(matrix))]
+    return NumpyRetriever(
+        embeddings=_FixedEmbeddings(query_vector),
+        matrix=matrix,
+        documents=documents,
+        k=k
+    )
+
+
+class TestNumpyRetriever:
+    """Test the cosine-similarity ranking"""
+
+    def test_top_k_returned_in_score_order(self):
+        """The k best matches come back best-first"""
+        retriever = _make_retriever([1.0, 0.0], k=3)
+        docs = retriever.invoke("query near the x axis")
+        assert [d.page_content for d in docs] == ["doc0", "doc1", "doc2"]
+
+    def test_opposite_query_reverses_order(self):
+        """Ranking tracks the query, not the matrix layout"""
+        retriever = _make_retriever([0.0, 1.0], k=3)
+        docs = retriever.invoke("query near the y axis")
+        assert [d.page_content for d in docs] == ["doc3", "doc2", "doc1"]
+
+    def test_k_capped_at_corpus_size(self):
+        """Asking for more documents than exist returns them all"""
+        retriever = _make_retriever([1.0, 0.0], k=10)
+        docs = retriever.invoke("query near the x axis")
+        assert len(docs) == 4
+
+    def test_query_vector_is_normalized(self):
+        """Query magnitude must not change the ranking"""
+        retriever = _make_retriever([250.0, 0.0], k=1)
+        docs = retriever.invoke("scaled query")
+        assert docs[0].page_content == "doc0"
+
+
+# Run tests with: pytest tests/test_numpy_retriever.py -v
+if __name__ == "__main__":
+    import pytest
+    pytest.main([__file__, "-v", "--tb=short"])